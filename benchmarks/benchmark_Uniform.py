@@ -12,7 +12,7 @@ import random
 from tasks.task import Task
 from tasks.taskset import TaskSet
 from cechains.chain import CEChain
-from multiprocessing import Pool
+import utilities.parallel as parallel
 import itertools
 
 
@@ -186,7 +186,7 @@ def generate_periods_loguniform_discrete(num_tasks, min_period,
 # Parallelized functions
 ###
 
-def generate_uniform_tasksets(taskset_generation_params, number_of_threads):
+def generate_uniform_tasksets(taskset_generation_params, number_of_threads, executor=None):
     """Parallelizes the uniform taskset generation and generates a list of tasksets with
     the given parameters
     """
@@ -195,7 +195,7 @@ def generate_uniform_tasksets(taskset_generation_params, number_of_threads):
     # generate seeds outside of worker threads to avoid duplicate random numbers
     seeds = [random.randint(0, 2**32 - 1) for _ in range(taskset_generation_params['number_of_tasksets'])]
 
-    with Pool(number_of_threads) as pool:
+    with parallel.pool(number_of_threads, executor) as pool:
         tasksets = pool.starmap(
             gen_taskset, 
             zip(
@@ -211,7 +211,7 @@ def generate_uniform_tasksets(taskset_generation_params, number_of_threads):
     return tasksets
 
 
-def generate_random_cecs(tasksets, cec_generation_params, number_of_threads):
+def generate_random_cecs(tasksets, cec_generation_params, number_of_threads, executor=None):
     """Parallelizes the uniform cause-effect chain generation and generates a list of 
     cause-effect chains with the given parameters
     """
@@ -221,7 +221,7 @@ def generate_random_cecs(tasksets, cec_generation_params, number_of_threads):
     # generate seeds outside of worker threads to avoid duplicate random numbers
     seeds = [random.randint(0, 2**32 - 1) for _ in range(number_of_tasksets)]
 
-    with Pool(number_of_threads) as pool:
+    with parallel.pool(number_of_threads, executor) as pool:
         cause_effect_chains = pool.starmap(
             gen_cause_effect_chains,
             zip(
@@ -5,7 +5,7 @@ From the paper: 'Real world automotive benchmark for free' (WATERS 2015).
 Basis from https://github.com/tu-dortmund-ls12-rt/end-to-end/blob/master/utilities/generator_WATERS.py
 and https://github.com/tu-dortmund-ls12-rt/end-to-end_mixed/blob/master/e2e/benchmark_WATERS.py
 """
-from multiprocessing import Pool
+import utilities.parallel as parallel
 from scipy import stats
 import numpy as np
 import random
@@ -340,7 +340,7 @@ def gen_ce_chains(task_set, number_chains_min, number_chains_max, seed):
 # Parallelized functions
 ###
 
-def generate_automotive_tasksets(taskset_generation_params, number_of_threads):
+def generate_automotive_tasksets(taskset_generation_params, number_of_threads, executor=None):
     """Parallelizes the automotive taskset generation and generates a list of tasksets with
     the given parameters
     """
@@ -349,7 +349,7 @@ def generate_automotive_tasksets(taskset_generation_params, number_of_threads):
     # generate seeds outside of worker threads to avoid duplicate random numbers
     seeds = [random.randint(0, 2**32 - 1) for _ in range(taskset_generation_params['number_of_tasksets'])]
 
-    with Pool(number_of_threads) as pool:
+    with parallel.pool(number_of_threads, executor) as pool:
         tasksets = pool.starmap(
             gen_taskset, 
             zip(
@@ -360,7 +360,7 @@ def generate_automotive_tasksets(taskset_generation_params, number_of_threads):
     return tasksets
 
 
-def generate_automotive_cecs(tasksets, cec_generation_params, number_of_threads):
+def generate_automotive_cecs(tasksets, cec_generation_params, number_of_threads, executor=None):
     """Parallelizes the automotive cause-effect chain generation and generates a list of 
     cause-effect chains with the given parameters
     """
@@ -370,7 +370,7 @@ def generate_automotive_cecs(tasksets, cec_generation_params, number_of_threads)
     # generate seeds outside of worker threads to avoid duplicate random numbers
     seeds = [random.randint(0, 2**32 - 1) for _ in range(number_of_tasksets)]
 
-    with Pool(number_of_threads) as pool:
+    with parallel.pool(number_of_threads, executor) as pool:
         cause_effect_chains = pool.starmap(
             gen_ce_chains,
             zip(
@@ -1,4 +1,5 @@
 from framework import *
+from utilities.scheduler import schedule_engines
 import getopt
 
 
@@ -58,6 +59,13 @@ def replace_value(dict, key, new_value):
     new_value is parsed into the type of the previous value.
     """
     old_value = dict[key]
+    if isinstance(old_value, str):
+        dict[key] = new_value
+        return
+    if old_value is None:
+        # optional number (e.g., a budget), unset by an empty value
+        dict[key] = float(new_value) if new_value != '' else None
+        return
     if new_value == '':
         dict[key] = True
         return
@@ -117,6 +125,10 @@ def runCLIMode(args):
 
         for option, value in options:
             option = option.replace('-', '')
+            if option in general_params.keys():
+                replace_value(general_params, option, value)
+            if option in output_params.keys():
+                replace_value(output_params, option, value)
             if option in taskset_generation_params.keys():
                 replace_value(taskset_generation_params, option, value)
             if option in cec_generation_params.keys():
@@ -174,6 +186,13 @@ def runCLIMode(args):
                 print_help()
                 return
 
+        if general_params['schedule_engine'] not in schedule_engines:
+            print(f"[ERROR] Unknown schedule engine: '{general_params['schedule_engine']}'")
+            print(f"[ERROR] Possible schedule engines: {schedule_engines}")
+            print('')
+            print_help()
+            return
+
 
     elif len(args) == 2 or len(args) == 3:
         # simplest mode
@@ -9,7 +9,9 @@ Implementation is based on a Java implementation provided by Matthias Becker
 """
 
 
+import bisect
 import math
+import numpy as np
 from tasks.task import Task
 from tasks.job import Job
 from cechains.chain import CEChain
@@ -21,84 +23,133 @@ Init_Type = Enum(
     'NO_INFORMATION RESPONSE_TIMES SCHED_TRACE LET'
 )
 
+vectorize_min_jobs = 32  # smaller ranges of jobs are searched without numpy
 
-class DPT_job(Job):
 
-    def __init__(self, task, occurrence, chain, init_type):
-        super().__init__(task, occurrence)
+class Job_Table:
+    """Interval bounds of all jobs of one task (indexed by occurrence) and
+    the exploration state (pushed rmin and dmin) of these jobs.
+    The bounds are kept as lists (for single jobs) and as arrays (for
+    the search of successors)."""
 
+    def __init__(self, task, chain, init_type, count, ana=None):
+        self.task = task
         self.chain = chain
-
         self.init_type = init_type
 
-        self.rmin = None
-        self.rmax = None
-        self.dmin = None
-        self.dmax = None
+        release = task.period * np.arange(count)
+
+        if init_type == Init_Type.NO_INFORMATION:
+            deadline = release + task.deadline
+            rmin = release
+            rmax = deadline - task.wcet
+            dmin = release + task.wcet
+            dmax = deadline + task.period
+
+        elif init_type == Init_Type.RESPONSE_TIMES:
+            wcrt = chain.base_ts.wcrts[task]
+            rmin = release
+            rmax = rmin + wcrt - task.wcet
+            dmin = rmin + task.wcet
+            dmax = rmin + task.period + wcrt
+
+        elif init_type == Init_Type.SCHED_TRACE:
+            # one schedule analyzer for all jobs of the chain
+            rmin = [ana.start(task, occurrence) for occurrence in range(count)]
+            rmax = rmin
+            dmin = [ana.finish(task, occurrence) for occurrence in range(count)]
+            dmax = dmin[1:] + [ana.finish(task, count)] if count > 0 else []
+
+        elif init_type == Init_Type.LET:
+            rmin = release
+            rmax = rmin
+            dmin = release + task.period
+            dmax = dmin + task.period
+
+        self.rmin = list(rmin) if isinstance(rmin, list) else rmin.tolist()
+        self.rmax = list(rmax) if isinstance(rmax, list) else rmax.tolist()
+        self.dmin = list(dmin) if isinstance(dmin, list) else dmin.tolist()
+        self.dmax = list(dmax) if isinstance(dmax, list) else dmax.tolist()
+
+        # exploration state
+        self.current_rmin = list(self.rmin)
+        self.current_dmin = list(self.dmin)
+
+        # arrays for the search of successors
+        self.rmax_array = np.array(self.rmax, dtype=float)
+        self.current_rmin_array = np.array(self.rmin, dtype=float)
+        self.sorted = (all(a <= b for a, b in zip(self.rmin, self.rmin[1:]))
+                       and all(a <= b for a, b in zip(self.rmax, self.rmax[1:])))
+
+        self.jobs = dict()  # DPT_jobs by occurrence (created when they are needed)
+
+    def __len__(self):
+        return len(self.rmin)
+
+    def job(self, occurrence):
+        if occurrence not in self.jobs:
+            self.jobs[occurrence] = DPT_job(self, occurrence)
+        return self.jobs[occurrence]
+
+    def set_rmin(self, occurrence, rmin, dmin):
+        self.current_rmin[occurrence] = rmin
+        self.current_rmin_array[occurrence] = rmin
+        self.current_dmin[occurrence] = dmin
+
+    def produces_data_for(self, first, last, dmin, dmax):
+        """Returns the occurrences in [first, last) of the jobs that read the
+        data of a job with the given dmin and dmax (produces_data_for,
+        vectorized for large ranges)."""
+        if last - first <= vectorize_min_jobs:
+            return [occurrence for occurrence in range(first, last)
+                    if self.rmax[occurrence] >= dmin and self.current_rmin[occurrence] < dmax]
+        mask = (self.rmax_array[first:last] >= dmin) & (self.current_rmin_array[first:last] < dmax)
+        return (first + np.flatnonzero(mask)).tolist()
+
+
+class DPT_job(Job):
+    """Job of a task in the chain. The interval bounds and the exploration
+    state are stored in the Job_Table of the task."""
+
+    def __init__(self, table, occurrence):
+        super().__init__(table.task, occurrence)
+
+        self.table = table
+        self.chain = table.chain
+        self.init_type = table.init_type
 
         self.start = None
         self.finish = None
 
         self.next = None
 
-        if init_type == Init_Type.SCHED_TRACE:
-            self.schedule = chain.base_ts.schedules['wcet']
-            self.ana = Schedule_Analyzer(self.schedule, chain.base_ts.hyperperiod())
+    @property
+    def rmin(self):
+        return self.table.current_rmin[self.occurrence]
 
-        self.reset_intervals()
+    @property
+    def rmax(self):
+        return self.table.rmax[self.occurrence]
 
+    @property
+    def dmin(self):
+        return self.table.current_dmin[self.occurrence]
 
-    
-    def reset_intervals(self):
-        
-        if self.init_type == Init_Type.NO_INFORMATION:
-            self.rmin = self.get_release()
-            self.rmax = self.get_deadline() - self.task.wcet
-            self.dmin = self.get_release() + self.task.wcet
-            self.dmax = self.get_deadline() + self.task.period
-
-        elif self.init_type == Init_Type.RESPONSE_TIMES:
-            self.rmin = self.get_release()
-            self.rmax = self.rmin + self.chain.base_ts.wcrts[self.task] - self.task.wcet
-            self.dmin = self.rmin + self.task.wcet
-            self.dmax = self.rmin + self.task.period + self.chain.base_ts.wcrts[self.task]
-
-        elif self.init_type == Init_Type.SCHED_TRACE:
-            self.rmin = self.ana.start(self.task, self.occurrence)
-            self.rmax = self.rmin
-            self.dmin = self.ana.finish(self.task, self.occurrence)
-            self.dmax = self.ana.finish(self.task, self.occurrence + 1)
-
-        elif self.init_type == Init_Type.LET:
-            self.rmin = self.get_release()
-            self.rmax = self.rmin
-            self.dmin = self.get_release() + self.task.period
-            self.dmax = self.dmin + self.task.period
-    
+    @property
+    def dmax(self):
+        return self.table.dmax[self.occurrence]
 
     def reset_rmin(self):
         
-        if self.init_type == Init_Type.NO_INFORMATION:
-            self.rmin = self.get_release()
-            self.dmin = self.rmin + self.task.wcet
-
-        elif self.init_type == Init_Type.RESPONSE_TIMES:
-            self.rmin = self.get_release()
-            self.dmin = self.rmin + self.task.wcet
-
-        elif self.init_type == Init_Type.SCHED_TRACE:
-            self.rmin = self.ana.start(self.task, self.occurrence)
-            self.dmin = self.ana.finish(self.task, self.occurrence)
-
-        elif self.init_type == Init_Type.LET:
-            self.rmin = self.get_release()
-            self.dmin = self.dmax
+        if self.init_type == Init_Type.LET:
+            self.table.set_rmin(self.occurrence, self.table.rmin[self.occurrence], self.dmax)
+        else:
+            self.table.set_rmin(self.occurrence, self.table.rmin[self.occurrence], self.table.dmin[self.occurrence])
 
 
     def push_rmin(self, time):
         if time > self.rmin:
-            self.rmin = time
-            self.dmin = self.rmin + self.task.wcet
+            self.table.set_rmin(self.occurrence, time, time + self.task.wcet)
 
 
     def produces_data_for(self, successor):
@@ -114,8 +165,8 @@ class DPT_Vertex:
         self.dpt_job = dpt_job
         self.max_branch_age = None
         self.final_node = False
-        self.incomming = []         # list of all incomming edges   [(vertex, valid)]
-        self.outgoing = []          # list of all outgoing edges    [(vertex, valid)]
+        self.incomming = dict()     # all incomming edges   {vertex: valid}
+        self.outgoing = dict()      # all outgoing edges    {vertex: valid}
     
     def set_branch_age(self, root_node, init_type):
         if init_type == Init_Type.LET:
@@ -132,12 +183,15 @@ class DPT_Vertex:
 
 class DataPropagationTree:
 
-    def __init__(self, ce_chain, all_jobs, init_type):
+    def __init__(self, ce_chain, job_tables, init_type):
         self.chain = ce_chain
         self.init_type = init_type
-        self.dpt_jobs = all_jobs
+        self.job_tables = job_tables    # Job_Table of each task (shared by all trees of the chain)
         self.root = None
-        self.vertex_list = []
+        self.vertices = dict()      # vertices by (task, occurrence) of their job
+
+    def add_vertex(self, vertex):
+        self.vertices[(vertex.dpt_job.task, vertex.dpt_job.occurrence)] = vertex
 
     def initialize_variables(self):
         ...
@@ -156,35 +210,40 @@ def compute_upper_bound(chain):
 
         return time
 
-def get_all_jobs(chain, init_type):
-    dpt_jobs = []
-
+def get_job_tables(chain, init_type):
     bound = compute_upper_bound(chain)
 
-    for task in chain:
+    ana = None
+    if init_type == Init_Type.SCHED_TRACE:
+        ana = Schedule_Analyzer(chain.base_ts.schedules['wcet'], chain.base_ts.hyperperiod())
 
+    job_tables = dict()
+    for task in chain:
         jobcount = math.floor(bound / task.period)
-        for i in range(jobcount):
-            dpt_jobs.append(DPT_job(task, i, chain, init_type))
+        job_tables[task] = Job_Table(task, chain, init_type, jobcount, ana)
 
-    return dpt_jobs
+    return job_tables
 
 
 # Analysis
 
 def analyze_data_age(ce_chain, init_type):
-    all_jobs = get_all_jobs(ce_chain, init_type)
-    initial_jobs = get_initial_jobs(all_jobs, ce_chain)
-    dpts = []
+    job_tables = get_job_tables(ce_chain, init_type)
+    initial_jobs = get_initial_jobs(job_tables, ce_chain)
+    branch_ends = dict()    # shared by the trees of all initial jobs
     max_data_age = 0
-    #print(len(all_jobs))
 
     for initial_job in initial_jobs:
-        dpt = DataPropagationTree(ce_chain, all_jobs, init_type)
+        dpt = DataPropagationTree(ce_chain, job_tables, init_type)
         dpt.root = DPT_Vertex(initial_job)
-        dpt.vertex_list.append(dpt.root)
-        max_data_age = max(recursive_dpt(dpt, dpt.root, ce_chain, init_type), max_data_age)
-        dpts.append(dpt)
+        dpt.add_vertex(dpt.root)
+        if init_type == Init_Type.LET:
+            # reset_rmin changes dmin under LET, hence subtrees are not reused
+            data_age = recursive_dpt(dpt, dpt.root, ce_chain, init_type)
+        else:
+            end = branch_end(dpt, dpt.root, ce_chain, init_type, branch_ends)
+            data_age = 0.0 if end is None else max(end - initial_job.rmin, 0.0)
+        max_data_age = max(data_age, max_data_age)
 
     return max_data_age
 
@@ -239,18 +298,76 @@ def recursive_dpt(
     return max_data_age
 
 
+def branch_end(
+    dpt : DataPropagationTree, 
+    vertex : DPT_Vertex, 
+    chain : CEChain,
+    init_type,
+    branch_ends : dict
+):
+    """Returns the latest end (rmax + wcet of the last job) of the branches
+    from vertex to the end of the chain, or None if no branch reaches the end.
+    The result only depends on the job of vertex and its (pushed) dmin, hence
+    it is stored in branch_ends and the subtree is explored only once for all
+    trees of the chain (not for LET)."""
+
+    job = vertex.dpt_job
+
+    if job.task == chain[-1]:
+        # end of chain is reached
+        vertex.final_node = True
+        vertex.set_branch_age(dpt.root, init_type)
+        return job.rmax + job.task.wcet
+
+    key = (job.task, job.occurrence, job.dmin)
+    if key in branch_ends:
+        return branch_ends[key]
+
+    successor_task = chain[chain.index(job.task)+1]
+    possible_successors = get_possible_successors(dpt, vertex, successor_task)
+
+    if init_type == Init_Type.NO_INFORMATION and possible_successors != []:
+        # only the last possible successor (as in recursive_dpt)
+        possible_successors = [possible_successors[-1]]
+
+    end = None
+    for successor in possible_successors:
+        successor.push_rmin(job.dmin)
+        v = append_job_to_graph(dpt, vertex, successor)
+        successor_end = branch_end(dpt, v, chain, init_type, branch_ends)
+        if successor_end is not None and (end is None or successor_end > end):
+            end = successor_end
+        successor.reset_rmin()
+
+    branch_ends[key] = end
+    return end
+
+
 def mark_invalid_edges():
     ...
 
 def get_root(dpt_vertex : DPT_Vertex):
     current_vertex = dpt_vertex
     while not current_vertex.is_root():
-        current_vertex = current_vertex.incomming[0][0]
+        current_vertex = next(iter(current_vertex.incomming))
     return current_vertex
 
 
 def get_possible_successors(dpt : DataPropagationTree, dpt_vertex : DPT_Vertex, successor : Task):
-    successors = [job for job in dpt.dpt_jobs if job.task == successor and dpt_vertex.dpt_job.produces_data_for(job)]
+    if successor not in dpt.job_tables:
+        return []
+    table = dpt.job_tables[successor]
+    dpt_job = dpt_vertex.dpt_job
+
+    if table.sorted:
+        # window of jobs with rmax >= dmin and rmin < dmax (the rmin of a job
+        # can only be pushed to a later time, hence the window is filtered again)
+        first = bisect.bisect_left(table.rmax, dpt_job.dmin)
+        last = bisect.bisect_left(table.rmin, dpt_job.dmax)
+    else:
+        first, last = 0, len(table)
+
+    successors = [table.job(occurrence) for occurrence in table.produces_data_for(first, last, dpt_job.dmin, dpt_job.dmax)]
 
     #if successors == []:
         #print(dpt_vertex.dpt_job)
@@ -260,9 +377,10 @@ def get_possible_successors(dpt : DataPropagationTree, dpt_vertex : DPT_Vertex,
 
 
 
-def get_initial_jobs(all_jobs, chain):
+def get_initial_jobs(job_tables, chain):
     #last_instance = chain.hyperperiod() / chain[0].period
-    initial_jobs = [job for job in all_jobs if job.task == chain[0]]
+    table = job_tables[chain[0]]
+    initial_jobs = [table.job(occurrence) for occurrence in range(len(table))]
     return initial_jobs
 
 
@@ -272,23 +390,17 @@ def append_job_to_graph(dpt : DataPropagationTree, source : DPT_Vertex, destinat
     # only create a new vertex if there is no vertex with that job in the graph already
     if destination == None:
         destination = DPT_Vertex(destination_job)
-        dpt.vertex_list.append(destination)
+        dpt.add_vertex(destination)
 
-    if source.outgoing.count((destination, True)) == 0:
-        source.outgoing.append((destination, True))
+    if source.outgoing.get(destination) is not True:
+        source.outgoing[destination] = True
 
     return destination
 
 
-# searches the graph for a vertex with the given dpt_job
+# returns the vertex of the graph with the given dpt_job (or None)
 def get_vertex(dpt : DataPropagationTree, dpt_job : DPT_job):
-
-    vertices = [vertex for vertex in dpt.vertex_list if vertex.dpt_job == dpt_job]
-
-    if len(vertices) == 1:
-        return vertices[0]
-    elif len(vertices) == 0:
-        return None
+    return dpt.vertices.get((dpt_job.task, dpt_job.occurrence))
 
         
 
@@ -29,7 +29,8 @@ def guenzel23_local_mrt(chain):
     return mrt
 
 
-def guenzel23_local_mda(chain):
+def guenzel23_local_ages(chain):
+    """Return (MDA, MRDA) of chain, both are computed by one analysis."""
     assert len(chain.base_ts.schedules.keys()) > 0
     schedules = chain.base_ts.schedules
 
@@ -40,20 +41,16 @@ def guenzel23_local_mda(chain):
         schedules['bcet']
     )
 
-    return mda
+    return mda, mrda
 
 
-def guenzel23_local_mrda(chain):
-    assert len(chain.base_ts.schedules.keys()) > 0
-    schedules = chain.base_ts.schedules
+def guenzel23_local_mda(chain):
+    mda, mrda = guenzel23_local_ages(chain)
+    return mda
 
-    mda, mrda = analyzer.max_age_local(
-        chain, 
-        chain.base_ts,
-        schedules['wcet'], 
-        schedules['bcet']
-    )
 
+def guenzel23_local_mrda(chain):
+    mda, mrda = guenzel23_local_ages(chain)
     return mrda
 
 
@@ -1,12 +1,15 @@
 import itertools
+import math
 import random
 from benchmarks.benchmark_Uniform import gen_taskset
 from cechains.chain import CEChain
+from e2eAnalyses.Becker2017 import becker17_SCHED_TRACE
 from e2eAnalyses.Guenzel2023_inter import guenzel23_local_mrt
 from framework import adjust_taskset_bcets, remove_invalid_tasksets
 from tasks.task import Task
 from tasks.taskset import TaskSet
-from utilities.scheduler import schedule_task_set
+import utilities.event_simulator as es
+from utilities.scheduler import schedule_task_set, reschedule_task_set, simulation_interval, Schedule_Analyzer
 
 
 # Automated Search
@@ -70,7 +73,8 @@ def search():
             removed +=1
             continue
         
-        taskset_after.schedules = schedule_task_set(ce_chains_after, taskset_after)[1]
+        # only the swapped tasks and below have to be simulated again
+        taskset_after.schedules = reschedule_task_set(ce_chains_after, taskset_after, taskset, taskset.schedules)[1]
 
         res_after = []
         for ce in ce_chains_after:
@@ -148,7 +152,8 @@ def search2():
             removed +=1
             continue
         
-        taskset_after.schedules = schedule_task_set(ce_chains_after, taskset_after)[1]
+        # only the swapped tasks and below have to be simulated again
+        taskset_after.schedules = reschedule_task_set(ce_chains_after, taskset_after, taskset, taskset.schedules)[1]
 
         res_after = []
         for ce in ce_chains_after:
@@ -166,6 +171,125 @@ def search2():
             print(res_before, res_after)
             breakpoint()
 
+def check_analytic_schedules(runs=100):
+    '''Compare the analytic schedules with the simulated schedules of generated task sets.'''
+    for idx in range(runs):
+        taskset = gen_taskset(0.5,5,20,1,2000,True,random.randint(0, 2**32 - 1))
+        adjust_taskset_bcets(taskset, random.choice([0.5, 1.0]))
+        taskset.rate_monotonic_scheduling()
+        taskset.compute_wcrts()
+        if len(remove_invalid_tasksets([taskset])) == 0:
+            continue
+
+        ce_chains = [CEChain(taskset[i], base_ts=taskset) for i in range(len(taskset))]
+        ce_chains += [CEChain(*random.sample(taskset.lst, random.randint(2, min(5, len(taskset)))), base_ts=taskset)
+                      for _ in range(10)]
+        # all jobs until the end of the simulation (later ones are shifted)
+        horizon = simulation_interval(ce_chains, taskset)[1]
+
+        # in ticks, the schedules have to be equal (ties are resolved the same way)
+        for ticks, eps in [(True, 0), (False, 0.000001)]:
+            simulated = schedule_task_set(ce_chains, taskset, ticks, engine='simulation')[1]
+            analytic = schedule_task_set(ce_chains, taskset, ticks, engine='analytic')[1]
+            for key in ['wcet', 'bcet']:
+                ana_sim = Schedule_Analyzer(simulated[key], taskset.hyperperiod())
+                ana_analytic = Schedule_Analyzer(analytic[key], taskset.hyperperiod())
+                for tsk in taskset:
+                    for nmb in range(int((horizon - tsk.phase) // tsk.period)):
+                        if (abs(ana_sim.start(tsk, nmb) - ana_analytic.start(tsk, nmb)) > eps
+                                or abs(ana_sim.finish(tsk, nmb) - ana_analytic.finish(tsk, nmb)) > eps):
+                            taskset.print_tasks()
+                            print(ticks, key, tsk.id, nmb)
+                            breakpoint()
+
+            # Becker 2017 compares the schedule entries exactly
+            res_sim = []
+            taskset.schedules = simulated
+            for ce in ce_chains:
+                res_sim.append(becker17_SCHED_TRACE(ce))
+            res_analytic = []
+            taskset.schedules = analytic
+            for ce in ce_chains:
+                res_analytic.append(becker17_SCHED_TRACE(ce))
+            if any(abs(a - b) > 0.000001 for a, b in zip(res_sim, res_analytic)):
+                taskset.print_tasks()
+                print(ticks, res_sim, res_analytic)
+                breakpoint()
+
+    print(f"Analytic schedules of {runs} task sets checked.")
+
+def check_rescheduled_ticks(runs=100):
+    '''Compare rescheduled tick schedules with full tick schedules, when the WCET
+    of one task is changed to a value that needs a finer time base.'''
+    for idx in range(runs):
+        taskset = gen_taskset(0.5,5,20,1,2000,True,random.randint(0, 2**32 - 1))
+        # time base of 0.1 time units
+        taskset = TaskSet(*[maketask(tsk.period, tsk.phase, max(round(tsk.wcet, 1), 0.1), max(round(tsk.wcet, 1), 0.1))
+                            for tsk in taskset])
+        taskset.rate_monotonic_scheduling()
+        taskset.compute_wcrts()
+        if len(remove_invalid_tasksets([taskset])) == 0:
+            continue
+        ce_chains = [CEChain(taskset[i], base_ts=taskset) for i in range(len(taskset))]
+        taskset.schedules = schedule_task_set(ce_chains, taskset, ticks=True)[1]
+
+        # WCET off the time base of taskset
+        changed = random.randrange(len(taskset))
+        tsk_lst = [tsk for tsk in taskset]
+        wcet = tsk_lst[changed].wcet + 0.0005
+        tsk_lst[changed] = maketask(tsk_lst[changed].period, tsk_lst[changed].phase, wcet, wcet)
+        taskset_after = TaskSet(*tsk_lst)
+        taskset_after.compute_wcrts()
+        if len(remove_invalid_tasksets([taskset_after])) == 0:
+            continue
+        ce_chains_after = [CEChain(taskset_after[i], base_ts=taskset_after) for i in range(len(taskset_after))]
+
+        rescheduled = reschedule_task_set(ce_chains_after, taskset_after, taskset, taskset.schedules)[1]
+        scheduled = schedule_task_set(ce_chains_after, taskset_after, ticks=True)[1]
+
+        horizon = simulation_interval(ce_chains_after, taskset_after)[1]
+        ana_re = Schedule_Analyzer(rescheduled['wcet'], taskset_after.hyperperiod())
+        ana_full = Schedule_Analyzer(scheduled['wcet'], taskset_after.hyperperiod())
+        for tsk in taskset_after:
+            for nmb in range(int((horizon - tsk.phase) // tsk.period)):
+                if (ana_re.start(tsk, nmb) != ana_full.start(tsk, nmb)
+                        or ana_re.finish(tsk, nmb) != ana_full.finish(tsk, nmb)):
+                    taskset_after.print_tasks()
+                    print(changed, tsk.id, nmb, ana_re.finish(tsk, nmb), ana_full.finish(tsk, nmb))
+                    breakpoint()
+
+    print(f"Rescheduled tick schedules of {runs} task sets checked.")
+
+def check_deadline_miss_schedules(runs=60):
+    '''Compare the schedules of task sets with deadline misses (random priorities)
+    with a simulation that does not stop early.'''
+    for idx in range(runs):
+        taskset = gen_taskset(0.9,5,10,1,100,True,random.randint(0, 2**32 - 1))
+        adjust_taskset_bcets(taskset, random.choice([0.5, 1.0]))
+        random.shuffle(taskset.lst)
+        taskset.compute_wcrts()
+        if len(remove_invalid_tasksets([taskset])) == 1:
+            continue
+
+        ce_chains = [CEChain(taskset[i], base_ts=taskset) for i in range(len(taskset))]
+        schedules = schedule_task_set(ce_chains, taskset)[1]
+
+        # all jobs until the end of the simulation are kept
+        sched_interval = simulation_interval(ce_chains, taskset)[0]
+        for key in ['wcet', 'bcet']:
+            simulator = es.eventSimulator(taskset, key == 'bcet', recording='array')
+            simulator.dispatcher(int(math.ceil(sched_interval / taskset[-1].period)))
+            full = simulator.e2e_result()
+            ana = Schedule_Analyzer(schedules[key], taskset.hyperperiod())
+            for tsk in taskset:
+                for nmb, (start, finish) in enumerate(full[tsk.id]):
+                    if ana.start(tsk, nmb) != start or ana.finish(tsk, nmb) != finish:
+                        taskset.print_tasks()
+                        print(key, tsk.id, nmb)
+                        breakpoint()
+
+    print(f"Schedules of {runs} task sets with deadline misses checked.")
+
 def maketask(period,phase,bcet,wcet):
     return Task('periodic', 'implicit', 'wcet', 'implicit', phase, period, period, period, bcet, wcet, period, None)
 
@@ -293,6 +417,9 @@ if __name__ == "__main__":
     # search()
     # search2()
     # finding1()
+    # check_analytic_schedules()
+    # check_rescheduled_ticks()
+    # check_deadline_miss_schedules()
     zhishan1()
     print("===")
     zhishan2()
@@ -6,7 +6,7 @@ from e2eAnalyses.Kloda2018 import kloda18
 from e2eAnalyses.Duerr2019 import duerr19, duerr19_mrt, duerr19_mrda
 from e2eAnalyses.Martinez2020 import martinez20_impl, martinez20_let
 from e2eAnalyses.Hamann2017 import hamann17
-from e2eAnalyses.Guenzel2023_inter import guenzel23_local_mrt, guenzel23_local_mda, guenzel23_local_mrda, guenzel23_inter_mrt, guenzel23_inter_mrda
+from e2eAnalyses.Guenzel2023_inter import guenzel23_local_mrt, guenzel23_local_ages, guenzel23_local_mda, guenzel23_local_mrda, guenzel23_inter_mrt, guenzel23_inter_mrda
 from e2eAnalyses.Guenzel2023_mixed import guenzel23_mix_pessimistic, guenzel23_mix, guenzel23_mix_improved
 from e2eAnalyses.Guenzel2023_equi import guenzel23_equi_mda, guenzel23_equi_mrt, guenzel23_equi_mrda, guenzel23_equi_mrrt
 from e2eAnalyses.Bi2022 import bi22, bi22_inter
@@ -18,24 +18,41 @@ from e2eAnalyses.Gohari2022 import gohari22
 import helpers
 import plotting.plot as plot
 import random as random
-from multiprocessing import Pool
 from utilities.scheduler import compute_all_schedules
+import utilities.cache as cache
+import utilities.parallel as parallel
+import utilities.supervisor as supervisor
 from utilities.yaml_export import export_to_yaml
 import time as time
+import contextlib
+import copy
+import functools
+import csv
+import os
 
 
 # debug output
 print_elapsed_time = False
+progress_interval = 10  # seconds between progress outputs of streamed analyses
 
 
 class AnalysisMethod:
-    """Class for describing e2e analysis methods"""
+    """Class for describing e2e analysis methods
 
-    def __init__(self, analysis_function, name, name_short, features):
+    Methods can declare a shared result: shared is a function that is computed
+    only once per local cause-effect chain for all selected methods with the
+    same shared function. The latency is then derived as derive(chain, result),
+    where result is the list of the shared results of the local chains for
+    interconnected cause-effect chains.
+    """
+
+    def __init__(self, analysis_function, name, name_short, features, shared=None, derive=None):
         self.analysis = analysis_function
         self.name = name
         self.name_short = name_short
         self.features = features
+        self.shared = shared
+        self.derive = derive
         self.latencies = []
 
     def reset(self):
@@ -51,7 +68,33 @@ class AnalysisMethod:
         if len(self.latencies) != len(baseline.latencies):
             return []
         else:
-            return [(b-a)/b for a,b in zip(self.latencies, baseline.latencies)]
+            # chains where one of the analyses exceeded its budget are skipped
+            return [(b-a)/b for a,b in zip(self.latencies, baseline.latencies)
+                    if not (supervisor.exceeded(a) or supervisor.exceeded(b))]
+
+    def valid_latencies(self):
+        """Returns the latencies without the chains where the analysis
+        exceeded its time or memory budget"""
+
+        return [latency for latency in self.latencies if not supervisor.exceeded(latency)]
+
+
+# derive functions for shared results
+# (module level functions, so that they can be sent to the workers)
+def same_result(chain, result):
+    return result
+
+def first_result(chain, result):
+    return result[0]
+
+def second_result(chain, result):
+    return result[1]
+
+def total_result(chains, results):
+    return sum(results)
+
+def total_second_result(chains, results):
+    return sum(result[1] for result in results)
 
 
 ########################################################
@@ -78,17 +121,17 @@ analysesDict = {
     'bi22_inter' : AnalysisMethod(bi22_inter, 'Bi 2022 (inter)', 'B22(I)', features=['periodic', 'implicit', 'inter']),
     'gohari22' : AnalysisMethod(gohari22, 'Gohari 2022', 'G22', features=['periodic', 'implicit']),
     'guenzel23_local_mrt' : AnalysisMethod(guenzel23_local_mrt, 'Günzel 2023 (local MRT)', 'G23(L-MRT)', features=['periodic', 'implicit', 'schedule']),
-    'guenzel23_local_mda' : AnalysisMethod(guenzel23_local_mda, 'Günzel 2023 (local MDA)', 'G23(L-MDA)', features=['periodic', 'implicit', 'schedule']),
-    'guenzel23_local_mrda' : AnalysisMethod(guenzel23_local_mrda, 'Günzel 2023 (local MRDA)', 'G23(L-MRDA)', features=['periodic', 'implicit', 'schedule']),
-    'guenzel23_inter_mrt' : AnalysisMethod(guenzel23_inter_mrt, 'Günzel 2023 (inter MRT)', 'G23(I-MRT)', features=['periodic', 'implicit', 'inter', 'schedule']),
-    'guenzel23_inter_mrda' : AnalysisMethod(guenzel23_inter_mrda, 'Günzel 2023 (inter MRDA)', 'G23(I-MRDA)', features=['periodic', 'implicit', 'inter', 'schedule']),
+    'guenzel23_local_mda' : AnalysisMethod(guenzel23_local_mda, 'Günzel 2023 (local MDA)', 'G23(L-MDA)', features=['periodic', 'implicit', 'schedule'], shared=guenzel23_local_ages, derive=first_result),
+    'guenzel23_local_mrda' : AnalysisMethod(guenzel23_local_mrda, 'Günzel 2023 (local MRDA)', 'G23(L-MRDA)', features=['periodic', 'implicit', 'schedule'], shared=guenzel23_local_ages, derive=second_result),
+    'guenzel23_inter_mrt' : AnalysisMethod(guenzel23_inter_mrt, 'Günzel 2023 (inter MRT)', 'G23(I-MRT)', features=['periodic', 'implicit', 'inter', 'schedule'], shared=guenzel23_local_mrt, derive=total_result),
+    'guenzel23_inter_mrda' : AnalysisMethod(guenzel23_inter_mrda, 'Günzel 2023 (inter MRDA)', 'G23(I-MRDA)', features=['periodic', 'implicit', 'inter', 'schedule'], shared=guenzel23_local_ages, derive=total_second_result),
     'guenzel23_mix_pessimistic' : AnalysisMethod(guenzel23_mix_pessimistic, 'Günzel 2023 (mixed, pessimistic)', 'G23(MIX-P)', features=['periodic', 'sporadic', 'implicit', 'LET', 'mixed']),
     'guenzel23_mix' : AnalysisMethod(guenzel23_mix, 'Günzel 2023 (mixed)', 'G23(MIX)', features=['periodic', 'sporadic', 'implicit', 'LET', 'mixed']),
     'guenzel23_mix_improved' : AnalysisMethod(guenzel23_mix_improved, 'Günzel 2023 (mixed improved)', 'G23(MIX-I)', features=['periodic', 'sporadic', 'implicit', 'LET', 'mixed']),
-    'guenzel23_equi_mda': AnalysisMethod(guenzel23_equi_mda, 'Günzel 2023 (equi MDA)', 'G23(EQ-MDA)', features=['periodic', 'LET']),
-    'guenzel23_equi_mrt': AnalysisMethod(guenzel23_equi_mrt, 'Günzel 2023 (equi MRT)', 'G23(EQ-MRT)', features=['periodic', 'LET']),
-    'guenzel23_equi_mrda': AnalysisMethod(guenzel23_equi_mrda, 'Günzel 2023 (equi MRDA)', 'G23(EQ-MRDA)', features=['periodic', 'LET']),
-    'guenzel23_equi_mrrt': AnalysisMethod(guenzel23_equi_mrrt, 'Günzel 2023 (equi MRRT)', 'G23(EQ-MRRT)', features=['periodic', 'LET']),
+    'guenzel23_equi_mda': AnalysisMethod(guenzel23_equi_mda, 'Günzel 2023 (equi MDA)', 'G23(EQ-MDA)', features=['periodic', 'LET'], shared=guenzel23_equi_mda, derive=same_result),
+    'guenzel23_equi_mrt': AnalysisMethod(guenzel23_equi_mrt, 'Günzel 2023 (equi MRT)', 'G23(EQ-MRT)', features=['periodic', 'LET'], shared=guenzel23_equi_mda, derive=same_result),
+    'guenzel23_equi_mrda': AnalysisMethod(guenzel23_equi_mrda, 'Günzel 2023 (equi MRDA)', 'G23(EQ-MRDA)', features=['periodic', 'LET'], shared=guenzel23_equi_mda, derive=guenzel23_equi_mrda),
+    'guenzel23_equi_mrrt': AnalysisMethod(guenzel23_equi_mrrt, 'Günzel 2023 (equi MRRT)', 'G23(EQ-MRRT)', features=['periodic', 'LET'], shared=guenzel23_equi_mda, derive=guenzel23_equi_mrrt),
     'guenzel23_equi_impl_sched': AnalysisMethod(guenzel23_equi_impl_sched, 'Günzel 2023 (equi+sched MRT)', 'G23(EQ-SCHED)', features=['periodic', 'implicit', 'schedule']),
     'guenzel23_equi_impl_rt': AnalysisMethod(guenzel23_equi_impl_rt, 'Günzel 2023 (equi+rt MRT)', 'G23(EQ-RT)', features=['periodic', 'implicit']),
     'beckerFast_NO_INFORMATION': AnalysisMethod(beckerFast_NO_INFORMATION, 'Becker Fast (Base MRDA)', 'BF', features=['periodic', 'implicit']),
@@ -110,6 +153,15 @@ default_general_params = {
     'cecs_file_path' : '',
     'yaml_file_path' : '',
     'number_of_threads' : 1,
+    'lazy_schedules' : False,
+    'integer_ticks' : False,
+    'schedule_engine' : 'simulation',
+    'cache_dir' : '',       # schedules and WCRTs are cached if given
+    'fused_analyses' : False,
+    'streaming_analyses' : False,
+    'checkpoint' : False,   # resume the evaluation in output_dir
+    'time_budget' : None,   # seconds per chain and analysis method
+    'memory_budget' : None, # MB per chain and analysis method
     'debug_output' : False
 }
 
@@ -222,8 +274,43 @@ def check_methods_and_cecs(analysis_methods, normalization_methods, cecs):
 ### Run Analyses ###
 ####################
 
-def performAnalyses(cause_effect_chains, methods, number_of_threads):
-    """Analyzes the given cause-effect chains with the given analysis methods"""
+def mapChains(function, cause_effect_chains, number_of_threads, executor=None):
+    """Returns [function(chain) for chain in cause_effect_chains], computed by
+    the workers of executor (the chains have to be shared with it as
+    'cause_effect_chains', see performAnalyses) or by a new pool."""
+
+    if executor is None or len(cause_effect_chains) == 0:
+        return parallel.map_indexed(function, cause_effect_chains, number_of_threads)
+    return executor.map(function, 'cause_effect_chains')
+
+
+def computeShared(shared, cause_effect_chains, number_of_threads, executor=None):
+    """Returns the shared result for each (local or interconnected) cause-effect chain.
+    The shared function is computed only once per distinct local cause-effect chain."""
+
+    if len(cause_effect_chains) == 0:
+        return []
+
+    # Case: local cause-effect chains
+    if not isinstance(cause_effect_chains[0], tuple):
+        return mapChains(functools.partial(analyzeIsolated, shared), cause_effect_chains,
+                         number_of_threads, executor)
+
+    # Case: interconnected cause-effect chains
+    # (the same local chain can be part of several interconnected chains)
+    local_chains = list({id(chain): chain for inter_chain in cause_effect_chains for chain in inter_chain}.values())
+    results = parallel.map_indexed(functools.partial(analyzeIsolated, shared), local_chains,
+                                   number_of_threads, executor=executor, name='local_chains')
+    result_of = {id(chain): result for chain, result in zip(local_chains, results)}
+
+    return [[result_of[id(chain)] for chain in inter_chain] for inter_chain in cause_effect_chains]
+
+
+def performAnalyses(cause_effect_chains, methods, number_of_threads, executor=None):
+    """Analyzes the given cause-effect chains with the given analysis methods
+    (with the workers of executor if given, otherwise with a new pool per method).
+    The chains are shared with the workers of executor only once, and each
+    analysis runs on its own copy of a chain (see analyzeIsolated)."""
 
     latencies_all = []
 
@@ -231,6 +318,12 @@ def performAnalyses(cause_effect_chains, methods, number_of_threads):
     for method in methods:
         method.reset()
 
+    if executor is not None and len(cause_effect_chains) > 0:
+        executor.share('cause_effect_chains', cause_effect_chains)
+
+    # shared results of the analysis methods (by shared function)
+    shared_results = dict()
+
     # compute new latencies
     for method in methods:
         if method == None:
@@ -249,16 +342,28 @@ def performAnalyses(cause_effect_chains, methods, number_of_threads):
         if method.name == 'Gohari 2022':
             latencies_single = method.analysis(cause_effect_chains)
 
+        # the result is derived from a result that is shared with other analyses
+        elif method.shared is not None:
+            if method.shared not in shared_results:
+                shared_results[method.shared] = computeShared(
+                    method.shared,
+                    cause_effect_chains,
+                    number_of_threads,
+                    executor
+                )
+            latencies_single = [method.derive(chain, result)
+                                for result, chain in zip(shared_results[method.shared], cause_effect_chains)]
+
         # default case for most analyses
         else:
-            if isinstance(cause_effect_chains[0], tuple):
-                # parallelization for interconnected cause-effect chains
-                with Pool(number_of_threads) as pool:
-                    latencies_single = pool.starmap(method.analysis, cause_effect_chains)
-            else:
-                # parallelization for local cause-effect chains
-                with Pool(number_of_threads) as pool:
-                    latencies_single = pool.map(method.analysis, cause_effect_chains)
+            # parallelization for interconnected (tuples) or local cause-effect chains
+            # (the workers only receive the function and the indices of the chains)
+            latencies_single = mapChains(
+                functools.partial(analyzeIsolated, method.analysis),
+                cause_effect_chains,
+                number_of_threads,
+                executor
+            )
 
         
         elapsed = time.time() - t
@@ -270,12 +375,373 @@ def performAnalyses(cause_effect_chains, methods, number_of_threads):
         latencies_all.append(latencies_single)
         method.latencies = latencies_single
 
-        # check if result can be reused for other analyses
-        ... #TODO
-
     return latencies_all
 
 
+def groupChains(cause_effect_chains):
+    """Returns the indices of the chains grouped by task set
+    (interconnected chains are analyzed one by one)"""
+
+    if isinstance(cause_effect_chains[0], tuple):
+        return [[idx] for idx in range(len(cause_effect_chains))]
+
+    groups_by_ts = dict()
+    for idx, chain in enumerate(cause_effect_chains):
+        groups_by_ts.setdefault(id(chain.base_ts), []).append(idx)
+    return list(groups_by_ts.values())
+
+
+def isolatedCopy(chain):
+    """Returns a copy of the (local or interconnected) cause-effect chain with
+    its task sets, so that the changes of one analysis (e.g., guenzel23_mix
+    reassigns the priorities of the tasks) do not reach the other analyses.
+    The schedules are not copied, since the analyses only read them."""
+
+    memo = dict()
+    for local_chain in (chain if isinstance(chain, tuple) else (chain,)):
+        if local_chain.base_ts is not None:
+            memo[id(local_chain.base_ts.schedules)] = local_chain.base_ts.schedules
+    return copy.deepcopy(chain, memo)
+
+
+def analyzeIsolated(analysis, chain):
+    """Returns the result of the analysis for a copy of the (local or
+    interconnected) cause-effect chain (see isolatedCopy)."""
+
+    isolated = isolatedCopy(chain)
+    return analysis(*isolated) if isinstance(chain, tuple) else analysis(isolated)
+
+
+def analyzeChains(analyses, chains, elapsed=None):
+    """Returns one row with the latencies of all analyses for each of the given
+    (local or interconnected) cause-effect chains.
+    analyses is a list of (analysis, shared, derive) tuples of the methods.
+    Each analysis runs on its own copy of the chain (see isolatedCopy), in which
+    the hyperperiod, maximal phase and task indices are computed only once.
+    Shared results are computed once per chain for all analyses.
+    The time of each analysis is added to elapsed (if given)."""
+
+    rows = []
+    for chain in chains:
+        shared_results = dict()
+        row = []
+        for column, (analysis, shared, derive) in enumerate(analyses):
+            isolated = isolatedCopy(chain)
+            local_chains = isolated if isinstance(chain, tuple) else (isolated,)
+            t = time.time()
+
+            with contextlib.ExitStack() as stack:
+                for local_chain in local_chains:
+                    if local_chain.base_ts is not None:
+                        stack.enter_context(local_chain.base_ts.fixed())
+                    stack.enter_context(local_chain.fixed())
+
+                # Case: analysis without shared result
+                if shared is None:
+                    row.append(analysis(*local_chains))
+
+                # Case: derived from a shared result
+                else:
+                    if shared not in shared_results:
+                        results = [shared(local_chain) for local_chain in local_chains]
+                        shared_results[shared] = results if isinstance(chain, tuple) else results[0]
+                    row.append(derive(isolated, shared_results[shared]))
+
+            if elapsed is not None:
+                elapsed[column] += time.time() - t
+
+        rows.append(row)
+
+    return rows
+
+
+def performAnalysesFused(cause_effect_chains, methods, number_of_threads, executor=None):
+    """Analyzes the given cause-effect chains with all given analysis methods in
+    one pass: one worker task evaluates all methods on all chains of one task
+    set (or on one interconnected chain).
+    Returns one row of latencies per chain (None for methods that are not implemented)."""
+
+    # delete values from previous runs
+    for method in methods:
+        if method is not None:
+            method.reset()
+
+    if len(cause_effect_chains) == 0:
+        return []
+
+    t = time.time()
+
+    # Gohari 2022 analyzes all chains at once
+    fused = [method for method in methods if method is not None and method.name != 'Gohari 2022']
+
+    groups = groupChains(cause_effect_chains)
+
+    results = parallel.map_indexed(
+        functools.partial(analyzeChains, [(method.analysis, method.shared, method.derive) for method in fused]),
+        [[cause_effect_chains[idx] for idx in group] for group in groups],
+        number_of_threads,
+        executor=executor,
+        name='chain_groups'
+    )
+
+    rows = [None] * len(cause_effect_chains)
+    for group, group_rows in zip(groups, results):
+        for idx, row in zip(group, group_rows):
+            rows[idx] = row
+
+    for column, method in enumerate(fused):
+        method.latencies = [row[column] for row in rows]
+
+    for method in methods:
+        if method is not None and method.name == 'Gohari 2022':
+            method.latencies = method.analysis(cause_effect_chains)
+
+    # debug output
+    if print_elapsed_time:
+        print(f'fused analyses: {time.time() - t}')
+
+    return [[None if method is None else method.latencies[idx] for method in methods]
+            for idx in range(len(cause_effect_chains))]
+
+
+def analyzeChainsTimed(analyses, chains):
+    """Returns the rows of analyzeChains and the time of each analysis"""
+
+    elapsed = [0.0] * len(analyses)
+    rows = analyzeChains(analyses, chains, elapsed)
+    return rows, elapsed
+
+
+def analyzeChainTimed(analysis, chain):
+    """Returns the latency of one analysis for one chain and its time"""
+
+    rows, elapsed = analyzeChainsTimed([analysis], [chain])
+    return rows[0][0], elapsed[0]
+
+
+def superviseAnalyses(cause_effect_chains, analyses, number_of_threads, time_budget, memory_budget):
+    """Yields ([idx], [row], elapsed) for each cause-effect chain when all
+    analyses of the chain are completed. Each (chain, analysis) pair runs in a
+    supervised worker on its own copy of the chain (see isolatedCopy) with the
+    time budget (seconds) and memory budget (MB)."""
+
+    tasks = [(functools.partial(analyzeChainTimed, analysis), idx)
+             for idx in range(len(cause_effect_chains)) for analysis in analyses]
+    completed = supervisor.imap_supervised(
+        tasks,
+        cause_effect_chains,
+        number_of_threads,
+        time_budget=time_budget,
+        memory_budget=None if memory_budget is None else int(memory_budget * 2**20),
+        isolate=isolatedCopy
+    )
+
+    rows = dict()
+    elapsed = dict()
+    for number, result in completed:
+        idx, column = divmod(number, len(analyses))
+        row = rows.setdefault(idx, [None] * len(analyses))
+        elapsed.setdefault(idx, [0.0] * len(analyses))
+
+        # Case: budget is exceeded
+        if supervisor.exceeded(result):
+            row[column] = result
+        else:
+            row[column], elapsed[idx][column] = result
+
+        if all(entry is not None for entry in row):
+            yield [idx], [rows.pop(idx)], elapsed.pop(idx)
+
+
+def iterAnalyses(cause_effect_chains, methods, number_of_threads, executor=None, time_budget=None, memory_budget=None):
+    """Yields (idx, row) with the latencies of all given analysis methods for
+    each cause-effect chain (in one pass per task set as performAnalysesFused)
+    in the order in which the chains are completed. Prints the progress.
+    With a time budget (seconds) or memory budget (MB) per chain and method,
+    each pair is analyzed by a supervised worker (see utilities.supervisor).
+    Gohari 2022 analyzes all chains at once before the other methods (without
+    budget) and its latencies are added to the rows."""
+
+    if len(cause_effect_chains) == 0:
+        return
+
+    at_once = {column: method.analysis(cause_effect_chains)
+               for column, method in enumerate(methods) if method.name == 'Gohari 2022'}
+    methods = [method for column, method in enumerate(methods) if column not in at_once]
+
+    def full_row(idx, row):
+        row = iter(row)
+        return [at_once[column][idx] if column in at_once else next(row)
+                for column in range(len(methods) + len(at_once))]
+
+    if len(methods) == 0:
+        for idx in range(len(cause_effect_chains)):
+            yield idx, full_row(idx, [])
+        return
+
+    analyses = [(method.analysis, method.shared, method.derive) for method in methods]
+
+    if time_budget is None and memory_budget is None:
+        groups = groupChains(cause_effect_chains)
+        completed = ((groups[group_idx], rows, elapsed) for group_idx, (rows, elapsed) in parallel.imap_indexed(
+            functools.partial(analyzeChainsTimed, analyses),
+            [[cause_effect_chains[idx] for idx in group] for group in groups],
+            number_of_threads,
+            executor=executor,
+            name='chain_groups'
+        ))
+    else:
+        completed = superviseAnalyses(cause_effect_chains, analyses, number_of_threads, time_budget, memory_budget)
+
+    start = last_report = time.time()
+    done = 0
+    elapsed_all = [0.0] * len(methods)
+    for indices, rows, elapsed in completed:
+        for idx, row in zip(indices, rows):
+            yield idx, full_row(idx, row)
+
+        done += len(rows)
+        elapsed_all = [a + b for a, b in zip(elapsed_all, elapsed)]
+
+        # progress output
+        now = time.time()
+        if now - last_report >= progress_interval or done == len(cause_effect_chains):
+            last_report = now
+            rate = done / max(now - start, 1e-9)
+            eta = (len(cause_effect_chains) - done) / rate
+            per_method = ', '.join(f'{method.name_short}: {1000 * t / done:.2f} ms/chain'
+                                   for method, t in zip(methods, elapsed_all))
+            print(f'{done}/{len(cause_effect_chains)} chains ({rate:.1f} chains/s, ETA {eta:.0f} s) | {per_method}')
+
+
+def performAnalysesStreaming(cause_effect_chains, methods, number_of_threads, results_file, executor=None,
+                             time_budget=None, memory_budget=None):
+    """Analyzes the given cause-effect chains with all given analysis methods
+    (in one pass per task set as performAnalysesFused) and appends the results
+    of each chain to the csv file results_file as soon as they are completed.
+    The latencies are not kept in memory (the rows are ordered by completion,
+    the first column is the index of the chain). Use loadStreamedResults to
+    obtain the latencies in the order of the chains."""
+
+    methods = [method for method in dict.fromkeys(methods) if method is not None]
+
+    # delete values from previous runs
+    for method in methods:
+        method.reset()
+
+    with open(results_file, 'w', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(['chain'] + [method.name_short for method in methods])
+
+        for idx, row in iterAnalyses(cause_effect_chains, methods, number_of_threads, executor, time_budget, memory_budget):
+            writer.writerow([idx] + row)
+            file.flush()
+
+
+def performAnalysesSupervised(cause_effect_chains, methods, number_of_threads, time_budget=None, memory_budget=None):
+    """Analyzes the given cause-effect chains with the given analysis methods,
+    where each (chain, method) pair is analyzed by a supervised worker with the
+    given time budget (seconds) and memory budget (MB). Pairs that exceed the
+    budget get the latency supervisor.TIMEOUT or supervisor.MEMORY_EXCEEDED."""
+
+    # delete values from previous runs
+    for method in methods:
+        if method is not None:
+            method.reset()
+
+    supervised = [method for method in dict.fromkeys(methods) if method is not None]
+
+    rows = [None] * len(cause_effect_chains)
+    for idx, row in iterAnalyses(cause_effect_chains, supervised, number_of_threads,
+                                 time_budget=time_budget, memory_budget=memory_budget):
+        rows[idx] = row
+
+    for column, method in enumerate(supervised):
+        method.latencies = [row[column] for row in rows]
+
+
+def parseLatency(value):
+    """Returns the latency of a csv entry (or the distinguished value of an exceeded budget)"""
+
+    return value if supervisor.exceeded(value) else float(value)
+
+
+def readCheckpoint(checkpoint_file):
+    """Returns the finished (chain, method) pairs with their latencies from the
+    checkpoint file. An incomplete last line (interrupted write) is removed."""
+
+    if not os.path.exists(checkpoint_file):
+        return dict()
+
+    with open(checkpoint_file, 'r', newline='') as file:
+        content = file.read()
+    complete = content[:content.rfind('\n') + 1]
+    if complete != content:
+        with open(checkpoint_file, 'w', newline='') as file:
+            file.write(complete)
+
+    finished = dict()
+    for row in list(csv.reader(complete.splitlines()))[1:]:
+        finished[(int(row[0]), row[1])] = parseLatency(row[2])
+    return finished
+
+
+def performAnalysesCheckpointed(cause_effect_chains, methods, number_of_threads, checkpoint_file, executor=None,
+                                time_budget=None, memory_budget=None):
+    """Analyzes the given cause-effect chains with all given analysis methods
+    (as performAnalysesStreaming) and records each finished (chain, method)
+    pair in the csv file checkpoint_file. Pairs that are already recorded by an
+    interrupted run are not analyzed again.
+    The latencies of the methods are set from the checkpoint at the end."""
+
+    methods = [method for method in dict.fromkeys(methods) if method is not None]
+
+    # delete values from previous runs
+    for method in methods:
+        method.reset()
+
+    finished = readCheckpoint(checkpoint_file)
+    if not os.path.exists(checkpoint_file) or os.path.getsize(checkpoint_file) == 0:
+        with open(checkpoint_file, 'w', newline='') as file:
+            csv.writer(file).writerow(['chain', 'method', 'latency'])
+
+    # chains with the same missing methods are analyzed together
+    missing = dict()
+    for idx in range(len(cause_effect_chains)):
+        pending = tuple(method for method in methods if (idx, method.name_short) not in finished)
+        if len(pending) > 0:
+            missing.setdefault(pending, []).append(idx)
+
+    with open(checkpoint_file, 'a', newline='') as file:
+        writer = csv.writer(file)
+        for pending, indices in missing.items():
+            for sub_idx, row in iterAnalyses([cause_effect_chains[idx] for idx in indices], list(pending), number_of_threads,
+                                             executor, time_budget, memory_budget):
+                for method, latency in zip(pending, row):
+                    writer.writerow([indices[sub_idx], method.name_short, latency])
+                    finished[(indices[sub_idx], method.name_short)] = parseLatency(str(latency))
+                file.flush()
+
+    for method in methods:
+        method.latencies = [finished[(idx, method.name_short)] for idx in range(len(cause_effect_chains))]
+
+
+def loadStreamedResults(methods, results_file):
+    """Sets the latencies of the given analysis methods from the csv file
+    written by performAnalysesStreaming (in the order of the chains)"""
+
+    with open(results_file, 'r', newline='') as file:
+        reader = csv.reader(file)
+        names = next(reader)
+        rows = sorted((int(row[0]), row[1:]) for row in reader)
+
+    for method in methods:
+        if method is None:
+            continue
+        column = names.index(method.name_short) - 1
+        method.latencies = [parseLatency(row[column]) for idx, row in rows]
+
+
 ###########################
 ### Interconnected cecs ###
 ###########################
@@ -339,9 +805,10 @@ def adjust_taskset_bcets(taskset, bcet_ratio):
 def generate_cecs(general_params,
                   taskset_generation_params,
                   cec_generation_params,
-                  output_params):
+                  output_params,
+                  executor=None):
     """Generates a list of cause-effect chains with the
-    given parameters
+    given parameters (with the workers of executor if given)
     """
     
     ### Parameter Check ###
@@ -357,14 +824,16 @@ def generate_cecs(general_params,
     if taskset_generation_params['use_automotive_taskset_generation']:
         tasksets = automotiveBench.generate_automotive_tasksets(
             taskset_generation_params, 
-            general_params['number_of_threads']
+            general_params['number_of_threads'],
+            executor
         )
 
     # selected uniform benchmark
     if taskset_generation_params['use_uniform_taskset_generation']:
         tasksets = uniformBench.generate_uniform_tasksets(
             taskset_generation_params,
-            general_params['number_of_threads']
+            general_params['number_of_threads'],
+            executor
         )
 
     for taskset in tasksets:
@@ -372,7 +841,10 @@ def generate_cecs(general_params,
         adjust_taskset_communication_policy(taskset, taskset_generation_params['let_ratio'])
         adjust_taskset_bcets(taskset, taskset_generation_params['bcet_ratio'])
         taskset.rate_monotonic_scheduling()
-        taskset.compute_wcrts()
+        if not (general_params['cache_dir'] and cache.load_wcrts(taskset, general_params['cache_dir'])):
+            taskset.compute_wcrts()
+            if general_params['cache_dir']:
+                cache.store_wcrts(taskset, general_params['cache_dir'])
 
     # remove tasksets with tasks that miss their deadline
     tasksets = remove_invalid_tasksets(tasksets)
@@ -386,14 +858,16 @@ def generate_cecs(general_params,
         cause_effect_chains = automotiveBench.generate_automotive_cecs(
             tasksets, 
             cec_generation_params,
-            general_params['number_of_threads']
+            general_params['number_of_threads'],
+            executor
         )
 
     if cec_generation_params['generate_random_cecs']:
         cause_effect_chains = uniformBench.generate_random_cecs(
             tasksets, 
             cec_generation_params,
-            general_params['number_of_threads']
+            general_params['number_of_threads'],
+            executor
         )
 
     if cec_generation_params['generate_interconnected_cecs']:
@@ -488,46 +962,117 @@ def run_evaluation(general_params,
     3. Generating the output files (diagrams/csv-file)
     """
 
-    ### Create/Load Chains from file ###
-
-    if general_params['load_cecs_from_file']:
-        cause_effect_chains = helpers.load_data(general_params['cecs_file_path'])
-    elif general_params['generate_cecs']:
-        cause_effect_chains = generate_cecs(
-            general_params,
-            taskset_generation_params,
-            cec_generation_params,
-            output_params
-        )
-    else:
+    if not (general_params['load_cecs_from_file'] or general_params['generate_cecs']):
         return ''
 
-
-    check_methods_and_cecs(
-        selected_analysis_methods,
-        selected_normalization_methods,
-        cause_effect_chains
-    )
-
-    ### Run Analyses ###
-
-    # check if at least one analysis method needs the schedule
-    schedule_needed = sum([method.features.count('schedule') for method in selected_analysis_methods + selected_normalization_methods]) > 0
-    if schedule_needed:
-        compute_all_schedules(
-            cause_effect_chains, 
-            general_params['number_of_threads']
+    # one pool of workers for generation, scheduling and all analyses
+    with parallel.Executor(general_params['number_of_threads']) as executor:
+
+        ### Create/Load Chains from file ###
+
+        if general_params['checkpoint']:
+            # the chains (with their WCRTs) and the finished analyses of an
+            # interrupted run are stored in the output directory
+            if output_params['output_dir'] == '':
+                output_params['output_dir'] = helpers.make_output_directory()
+            chains_file = output_params['output_dir'] + "cause_effect_chains.pickle"
+            # the schedules are stored in the cache
+            if general_params['cache_dir'] == '':
+                general_params['cache_dir'] = output_params['output_dir'] + "cache/"
+
+        if general_params['checkpoint'] and os.path.exists(chains_file):
+            cause_effect_chains = helpers.load_data(chains_file)
+        elif general_params['load_cecs_from_file']:
+            cause_effect_chains = helpers.load_data(general_params['cecs_file_path'])
+        elif general_params['generate_cecs']:
+            cause_effect_chains = generate_cecs(
+                general_params,
+                taskset_generation_params,
+                cec_generation_params,
+                output_params,
+                executor
+            )
+
+        if general_params['checkpoint'] and not os.path.exists(chains_file):
+            helpers.write_data(chains_file + ".tmp", cause_effect_chains)
+            os.replace(chains_file + ".tmp", chains_file)
+
+
+        check_methods_and_cecs(
+            selected_analysis_methods,
+            selected_normalization_methods,
+            cause_effect_chains
         )
 
-    performAnalyses(
-        cause_effect_chains,
-        selected_analysis_methods + selected_normalization_methods, 
-        general_params['number_of_threads']
-    )
+        ### Run Analyses ###
+
+        # check if at least one analysis method needs the schedule
+        schedule_needed = sum([method.features.count('schedule') for method in selected_analysis_methods + selected_normalization_methods]) > 0
+        if schedule_needed:
+            compute_all_schedules(
+                cause_effect_chains, 
+                general_params['number_of_threads'],
+                lazy=general_params['lazy_schedules'],
+                ticks=general_params['integer_ticks'],
+                engine=general_params['schedule_engine'],
+                cache_dir=general_params['cache_dir'],
+                executor=executor
+            )
+
+        if general_params['checkpoint']:
+            performAnalysesCheckpointed(
+                cause_effect_chains,
+                selected_analysis_methods + selected_normalization_methods,
+                general_params['number_of_threads'],
+                output_params['output_dir'] + "checkpoint.csv",
+                executor,
+                general_params['time_budget'],
+                general_params['memory_budget']
+            )
+        elif general_params['streaming_analyses']:
+            # the results are written to a separate csv file while they are computed
+            if output_params['output_dir'] == '':
+                output_params['output_dir'] = helpers.make_output_directory()
+            performAnalysesStreaming(
+                cause_effect_chains,
+                selected_analysis_methods + selected_normalization_methods,
+                general_params['number_of_threads'],
+                output_params['output_dir'] + "results_stream.csv",
+                executor,
+                general_params['time_budget'],
+                general_params['memory_budget']
+            )
+        elif general_params['time_budget'] is not None or general_params['memory_budget'] is not None:
+            performAnalysesSupervised(
+                cause_effect_chains,
+                selected_analysis_methods + selected_normalization_methods,
+                general_params['number_of_threads'],
+                general_params['time_budget'],
+                general_params['memory_budget']
+            )
+        else:
+            # one pass over all chains for all methods or one pass per method
+            analyze = performAnalysesFused if general_params['fused_analyses'] else performAnalyses
+            analyze(
+                cause_effect_chains,
+                selected_analysis_methods + selected_normalization_methods, 
+                general_params['number_of_threads'],
+                executor
+            )
 
 
     ### Generate output ###
 
+    if general_params['streaming_analyses'] and not general_params['checkpoint']:
+        # the latencies are only loaded for the output (results.csv is written
+        # in the same format as without streaming)
+        if (output_params['normalized_plots'] or output_params['absolute_plots']
+                or output_params['raw_analysis_results'] or output_params['print_to_console']):
+            loadStreamedResults(
+                selected_analysis_methods + selected_normalization_methods,
+                output_params['output_dir'] + "results_stream.csv"
+            )
+
     generate_output(
         output_params,
         selected_analysis_methods,
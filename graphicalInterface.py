@@ -504,7 +504,7 @@ def runVisualMode(window):
                 analysis_command = 'python3 e2eMain.py analyze-cecs -f cli_cause_effect_chains.pickle'
 
                 for param in general_params:
-                    if general_params[param] != False and general_params[param] != '' and param != 'generate_cecs':
+                    if general_params[param] is not None and general_params[param] != False and general_params[param] != '' and param != 'generate_cecs':
                         if isinstance(general_params[param], bool):
                             generation_command = generation_command + f' --{param}'
                             analysis_command = analysis_command + f' --{param}'
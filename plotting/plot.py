@@ -87,11 +87,11 @@ def create_absolute_plots(selected_analysis_methods,
 
     for method in selected_analysis_methods:
         if method.latencies != []:
-            plot(method.latencies, output_dir + method.name_short)
+            plot(method.valid_latencies(), output_dir + method.name_short)
 
     # only do comparison if there is something to compare
     if len(selected_analysis_methods) >= 2:
-        plot([method.latencies for method in selected_analysis_methods], 
+        plot([method.valid_latencies() for method in selected_analysis_methods], 
                     output_dir + "absolute", 
                     xticks=[method.name_short for method in selected_analysis_methods], 
                     title="Absolute Comparison"
@@ -2,6 +2,7 @@
 Basis from https://github.com/tu-dortmund-ls12-rt/end-to-end_mixed/blob/master/e2e/tasks/taskset.py
 """
 
+import contextlib
 import math
 import uuid
 from tasks.task import Task
@@ -13,6 +14,8 @@ class TaskSet:
     # Assumption: Task set ordered by priority
     # Lower index = Higher Priority
 
+    _fixed = None  # values computed only once while the task set is fixed
+
     def __init__(self, *args):
         """Input: Task-Objects"""
         self._lst = list(args)
@@ -45,7 +48,39 @@ class TaskSet:
         self._lst = new_lst
 
     def index(self, task):
-        return self._lst.index(task)
+        if self._fixed is None:
+            return self._lst.index(task)
+        positions = self._once('index', self._positions)
+        if id(task) not in positions:
+            return self._lst.index(task)  # raises ValueError
+        return positions[id(task)]
+
+    def _positions(self):
+        """First position of each task (by id), as found by list.index."""
+        positions = dict()
+        for idx, task in enumerate(self._lst):
+            positions.setdefault(id(task), idx)
+        return positions
+
+    @contextlib.contextmanager
+    def fixed(self):
+        """Context in which the task set is not changed, so that hyperperiod,
+        max_phase and index are computed only once."""
+        if self._fixed is not None:
+            yield self
+            return
+        self._fixed = dict()
+        try:
+            yield self
+        finally:
+            del self._fixed
+
+    def _once(self, name, compute):
+        if self._fixed is None:
+            return compute()
+        if name not in self._fixed:
+            self._fixed[name] = compute()
+        return self._fixed[name]
 
     def append(self, task):
         self._lst.append(task)
@@ -53,7 +88,7 @@ class TaskSet:
 
     def prio(self, task):
         """Priority of a task"""
-        return self._lst.index(task)
+        return self.index(task)
 
     def higher_prio(self, task1, task2):
         """task1 has higher prio than task2."""
@@ -110,11 +145,11 @@ class TaskSet:
 
     def hyperperiod(self):
         """Task set hyperperiod."""
-        return math.lcm(*[task.period for task in self._lst])
+        return self._once('hyperperiod', lambda: math.lcm(*[task.period for task in self._lst]))
 
     def max_phase(self):
         """Maximal phase of the task set."""
-        return max([task.phase for task in self._lst])
+        return self._once('max_phase', lambda: max([task.phase for task in self._lst]))
 
     def sort_dm(self):
         """Sort by deadline."""
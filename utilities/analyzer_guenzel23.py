@@ -5,57 +5,60 @@ Utility file for guenzel_23_inter
 
 
 import itertools
+import numpy as np
+from utilities.scheduler import ShiftedJobLists, closed_form_jobs, job_list, time_scale
+from utilities.event_simulator import to_ticks
 
 
 class re_we_analyzer():
     def __init__(self, bcet_schedule, wcet_schedule, hyperperiod):
-        self.bc = bcet_schedule
-        self.wc = wcet_schedule
         self.hyperperiod = hyperperiod
-
-    def _get_entry(self, nmb, lst, tsk):
-        '''get nmb-th entry of the list lst with task tsk.'''
+        # entries of tick schedules are converted only when they are returned
+        self.scale = time_scale(wcet_schedule)
+        self.ticks = self.scale != 1
+        self.shift = to_ticks(hyperperiod, self.scale)
+        self.bc = ShiftedJobLists(bcet_schedule, hyperperiod, self.shift)
+        self.wc = (self.bc if wcet_schedule is bcet_schedule
+                   else ShiftedJobLists(wcet_schedule, hyperperiod, self.shift))
+
+    def _get_entry(self, nmb, lst, tsk, job_lists):
+        '''get nmb-th entry of the list lst with task tsk from job_lists.'''
         if nmb < 0:  # Case: out of range
             raise IndexError('nmb<0')
-        # Case: index too high, has to be made smaller # TODO not sure if this is a good idea since the last entries could be wrong depending on the implementation of the scheduler ...
-        elif nmb >= len(lst):
-            # check one hyperperiod earlier
-            # make new_nmb an integer value
-            div, rem = divmod(self.hyperperiod, tsk.period)
-            assert rem == 0
-            new_nmb = nmb - div
-            # add one hyperperiod
-            # TODO this is not very efficient since we need the values several times.
-            return [self.hyperperiod + entry for entry in self._get_entry(new_nmb, lst, tsk)]
-        else:  # Case: entry can be used
-            try:
-                return lst[nmb]
-            except:
-                breakpoint()
+
+        if nmb < len(lst):  # Case: entry is known
+            return lst[nmb]
+
+        # Case: index too high, the job list is extended by shifting
+        return job_lists.extend(tsk, nmb)[nmb]
 
     def remin(self, task, nmb):
         '''returns the upper bound on read-event of the nbm-th job of a task.'''
         lst = self.bc[task.id]  # list that has the read-event minimum
-        # choose read-event from list
-        return self._get_entry(nmb, lst, task)[0]
+        # choose read-event from list (known entries are used directly)
+        entry = lst[nmb][0] if 0 <= nmb < len(lst) else self._get_entry(nmb, lst, task, self.bc)[0]
+        return entry / self.scale if self.ticks else entry
 
     def remax(self, task, nmb):
         '''returns the upper bound on read-event of the nbm-th job of a task.'''
         lst = self.wc[task.id]  # list that has the read-event maximum
-        # choose read-event from list
-        return self._get_entry(nmb, lst, task)[0]
+        # choose read-event from list (known entries are used directly)
+        entry = lst[nmb][0] if 0 <= nmb < len(lst) else self._get_entry(nmb, lst, task, self.wc)[0]
+        return entry / self.scale if self.ticks else entry
 
     def wemin(self, task, nmb):
         '''returns the upper bound on read-event of the nbm-th job of a task.'''
         lst = self.bc[task.id]  # list that has the write-event minimum
-        # choose write-event from list
-        return self._get_entry(nmb, lst, task)[1]
+        # choose write-event from list (known entries are used directly)
+        entry = lst[nmb][1] if 0 <= nmb < len(lst) else self._get_entry(nmb, lst, task, self.bc)[1]
+        return entry / self.scale if self.ticks else entry
 
     def wemax(self, task, nmb):
         '''returns the upper bound on read-event of the nbm-th job of a task.'''
         lst = self.wc[task.id]  # list that has the write-event maximum
-        # choose write-event from list
-        return self._get_entry(nmb, lst, task)[1]
+        # choose write-event from list (known entries are used directly)
+        entry = lst[nmb][1] if 0 <= nmb < len(lst) else self._get_entry(nmb, lst, task, self.wc)[1]
+        return entry / self.scale if self.ticks else entry
 
     def find_next_fw(self, curr_task_wc, nxt_task_bc, curr_index):
         '''Find next index for the abstract representation in forward manner.'''
@@ -287,17 +290,11 @@ def execution_zero_schedule(task_set):
     hyperperiod = task_set.hyperperiod()
     max_phase = max([task.phase for task in task_set])
 
-    # Initialize result dictionary.
     result = dict()
     for task in task_set:
-        result[task.id] = []
-
-    for task in task_set:
-        curr_time = task.phase
-        while curr_time <= max_phase + 2 * hyperperiod:
-            # start and finish directly at release
-            result[task.id].append((curr_time, curr_time))
-            curr_time += task.period
+        # start and finish directly at release (also for LET tasks)
+        releases = closed_form_jobs(task, max_phase + 2 * hyperperiod)[:, 0]
+        result[task.id] = job_list(np.column_stack((releases, releases)))
 
     return result
 
@@ -0,0 +1,140 @@
+"""
+Persistent cache for preprocessing artifacts (WCRTs and schedules)
+
+Entries are keyed by a hash of the task parameters in priority order and the
+parameters of the schedule construction. Hence, they are reused by all runs
+on the same task sets, independent of the task ids. Schedules are stored as
+.npy files and memory-mapped when they are loaded.
+"""
+
+import hashlib
+import os
+import numpy as np
+
+CACHE_VERSION = 1  # increase if the stored schedules change
+
+
+def taskset_key(task_set, *params):
+    """Return a canonical hash of the tasks of task_set (in priority order)
+    and additional parameters."""
+
+    def canonical(value):
+        if isinstance(value, (int, float, np.number)) and not isinstance(value, bool):
+            return float(value).hex()
+        return value
+
+    digest = hashlib.sha256(repr(CACHE_VERSION).encode())
+    for task in task_set:
+        digest.update(repr(tuple(canonical(value) for value in (
+            task.release_pattern, task.communication_policy, task.phase,
+            task.min_iat, task.max_iat, task.period, task.deadline,
+            task.bcet, task.wcet))).encode())
+    digest.update(repr(tuple(canonical(value) for value in params)).encode())
+    return digest.hexdigest()
+
+
+def _path(cache_dir, key, suffix):
+    return os.path.join(cache_dir, key + suffix)
+
+
+def _save(path, array):
+    """Write array atomically (concurrent runs may use the same cache)."""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp = f'{path}.{os.getpid()}.tmp'
+    with open(tmp, 'wb') as file:
+        np.save(file, array)
+    os.replace(tmp, path)
+
+
+def load_wcrts(task_set, cache_dir):
+    """Set task_set.wcrts from the cache. Returns False if they are not cached."""
+    path = _path(cache_dir, taskset_key(task_set, 'wcrts'), '.wcrts.npy')
+    if not os.path.exists(path):
+        return False
+    wcrts = np.load(path)
+    task_set.wcrts = {task: wcrt for task, wcrt in zip(task_set, wcrts.tolist())}
+    return True
+
+
+def store_wcrts(task_set, cache_dir):
+    """Store task_set.wcrts in the cache."""
+    path = _path(cache_dir, taskset_key(task_set, 'wcrts'), '.wcrts.npy')
+    _save(path, np.array([task_set.wcrts[task] for task in task_set], dtype=float))
+
+
+class CachedSchedule(dict):
+    """Schedule (task id -> jobs) that is read from a memory-mapped cache
+    entry on demand. The jobs of a task are a (jobs x 2) ndarray view of the
+    memory map, so that the processes that read the same entry share its
+    pages instead of holding copies (Schedule_Analyzer and job_array accept
+    such arrays as job lists).
+    A pickled CachedSchedule only consists of the path and the offsets of the
+    tasks, the receiving process maps the cache entry again."""
+
+    def __init__(self, path, offsets, scale=None):
+        super().__init__()
+        self.path = path
+        self.offsets = offsets  # task id -> (first, last + 1) row of its jobs
+        self.scale = scale  # entries are ticks if not None
+        self.data = None
+
+    def __missing__(self, task_id):
+        first, end = self.offsets[task_id]
+        if self.data is None:
+            self.data = np.load(self.path, mmap_mode='r')
+        jobs = self[task_id] = self.data[first:end].view(np.ndarray)
+        return jobs
+
+    def keys(self):
+        return self.offsets.keys()
+
+    def __reduce__(self):
+        return (CachedSchedule, (self.path, self.offsets, self.scale))
+
+
+def load_schedules(task_set, number, key, cache_dir):
+    """Return the cached schedules of the first number tasks of task_set
+    (format of schedule_task_set, see CachedSchedule) or None if they are
+    not cached."""
+
+    path = _path(cache_dir, key, '.npy')
+    index_path = _path(cache_dir, key, '.index.npy')
+    if not (os.path.exists(path) and os.path.exists(index_path)):
+        return None
+
+    # the index is written after the jobs, it has to end with the last job
+    # (otherwise the files belong to different writes)
+    index = np.load(index_path).tolist()
+    if index[-1][-1] != np.load(path, mmap_mode='r').shape[0] or len(index[0]) != number + 1:
+        return None
+
+    schedules = dict()
+    for schedule_key, offsets in zip(['wcet', 'bcet'], index):
+        schedules[schedule_key] = CachedSchedule(path, {
+            task_set[idx].id: (offsets[idx], offsets[idx + 1])
+            for idx in range(number)})
+    if len(index) == 1:
+        schedules['bcet'] = schedules['wcet']
+    return schedules
+
+
+def store_schedules(task_set, number, key, cache_dir, schedules):
+    """Store the schedules of the first number tasks of task_set in the cache.
+    All jobs are stored in one (jobs x 2) array with the offsets of the tasks
+    in a separate index array. The index is written last, so that
+    load_schedules can check that both files belong together."""
+
+    keys = ['wcet'] if schedules['bcet'] is schedules['wcet'] else ['wcet', 'bcet']
+    arrays = []
+    index = np.zeros((len(keys), number + 1), dtype=np.int64)
+    for row, schedule_key in enumerate(keys):
+        for idx in range(number):
+            jobs = np.asarray(schedules[schedule_key][task_set[idx].id]).reshape(-1, 2)
+            arrays.append(jobs)
+            index[row, idx + 1] = index[row, idx] + len(jobs)
+        if row > 0:
+            index[row] += index[row - 1, -1]
+
+    # jobs first, index last (see load_schedules)
+    _save(_path(cache_dir, key, '.npy'), np.concatenate(arrays))
+    _save(_path(cache_dir, key, '.index.npy'), index)
@@ -7,7 +7,44 @@ Simulator to create the schedule
 """
 
 from __future__ import division
+import heapq
+import math
 import operator
+import random
+import numpy as np
+
+
+def tick_scale(tasks, max_scale=10**9):
+    """Return the smallest power of ten scale (at most max_scale) such that
+    all time parameters of the tasks are integer multiples of 1/scale.
+
+    If there is no such scale (e.g., WCETs from the WATERS benchmark),
+    max_scale is returned and the parameters are rounded to it.
+    """
+    values = []
+    for task in tasks:
+        values.extend([task.phase, task.period, task.deadline, task.wcet,
+                       task.bcet])
+    scale = 1
+    while scale < max_scale:
+        if all(abs(value * scale - round(value * scale)) <= 1e-6
+               for value in values):
+            return scale
+        scale *= 10
+    return max_scale
+
+
+def to_ticks(value, scale, rounding=round):
+    """Convert a time value to an integer number of ticks of length 1/scale.
+
+    Values that are integer multiples up to numerical noise are rounded to the
+    nearest tick, otherwise the given rounding function (math.ceil for upper
+    bounds, math.floor for lower bounds) is used.
+    """
+    ticks = value * scale
+    if abs(ticks - round(ticks)) <= 1e-6:
+        return int(round(ticks))
+    return int(rounding(ticks))
 
 
 class eventSimulator:
@@ -15,17 +52,95 @@ class eventSimulator:
     constrained deadline and synchronous releases for the single ECU case.
     """
 
-    def __init__(self, tasks, bcet=False):
+    engines = ['heap', 'list']  # possible event engines
+    recordings = ['list', 'array']  # possible schedule recordings
+
+    def __init__(self, tasks, bcet=False, engine='heap', recording='list',
+                 horizon=None, hyperperiod=None, blocking=None,
+                 statistics=False, seed=None, scale=None, boundary=None):
         """Initialize the event simulator.
 
         We assume that the tasks are sorted by their priority (highest priority
         first).
+
+        engine = 'heap' keeps the events on absolute timestamps in a binary
+        heap (O(log n) per event). engine = 'list' is the original engine that
+        re-sorts a list of relative deltas at every release. Both produce the
+        same schedule.
+
+        recording = 'list' collects start and finish times in raw_result.
+        recording = 'array' writes them directly into one preallocated
+        (jobs x 2) NumPy array per task. The capacity is derived from horizon
+        (length of the simulated interval) and grows if it is exceeded.
+
+        If hyperperiod is given, the simulation stops early as soon as the
+        processor is idle at two consecutive hyperperiod boundaries
+        max_phase + k * hyperperiod. From the first of them on, the schedule
+        repeats every hyperperiod, so later jobs can be obtained by shifting
+        the jobs of the last simulated hyperperiod (as done by the
+        Schedule_Analyzer). After a deadline miss, the simulation does not
+        stop early, since the workload of a late job is merged with the next
+        job of the task and the recorded jobs do not match the releases
+        anymore. boundary replaces max_phase as the first boundary
+        (e.g., the maximal phase of a task set whose highest priority tasks
+        are given as blocking).
+
+        blocking is an optional sorted list of disjoint intervals
+        (start, length) in which the processor is busy with higher priority
+        tasks that are not simulated. The start of an interval has to be a
+        release of such a task.
+
+        With statistics = True, the simulator additionally records the
+        observed response time of each job and the length of each busy
+        period while simulating.
+
+        If seed is given, tasks with release_pattern = 'sporadic' are released
+        sporadically. Their inter-arrival times are drawn uniformly from
+        [min_iat, max_iat] by a random generator with that seed. Since the
+        schedule does not repeat then, hyperperiod must not be given.
+
+        If scale is given (see tick_scale), the simulator works on integer
+        ticks of length 1/scale: all task parameters are converted to ticks
+        (wcet rounded up, bcet rounded down) and all recorded times and
+        statistics are in ticks. Comparisons are then exact and the
+        arithmetic stays on Python ints and int64 arrays.
         """
+        if engine not in self.engines:
+            raise ValueError(f'{engine} is not a possible argument.')
+
+        if recording not in self.recordings:
+            raise ValueError(f'{recording} is not a possible argument.')
+
+        if seed is not None and hyperperiod is not None:
+            raise ValueError('Sporadic releases do not repeat every hyperperiod.')
+
         self.tasks = tasks  # list of tasks
         self.bcet = bcet
+        self.engine = engine
+        self.recording = recording
+        self.horizon = horizon
+        self.scale = scale
+        self.hyperperiod = self.toTicks(hyperperiod)
+        self.blocking = [(self.toTicks(start), self.toTicks(length))
+                         for start, length in (blocking or [])]
+        self.blocked = 0  # remaining time the processor is blocked
+        self.statistics = statistics
+        self.random = random.Random(seed) if seed is not None else None
         self.h = -1  # index of the active task with the highest workload
+        self.readyMask = 0  # bit i is set iff task i has remaining workload
         self.n = len(tasks)  # number of tasks
-        self.systemTick = float(0)  # current time
+        self.systemTick = float(0) if scale is None else 0  # current time
+
+        # Task parameters (in ticks if scale is given).
+        self.phases = [self.toTicks(task.phase) for task in tasks]
+        self.periods = [self.toTicks(task.period) for task in tasks]
+        self.deadlines = [self.toTicks(task.deadline) for task in tasks]
+        if scale is None:
+            self.wcets = [float(task.wcet) for task in tasks]
+            self.bcets = [float(task.bcet) for task in tasks]
+        else:
+            self.wcets = [self.toTicks(task.wcet, math.ceil) for task in tasks]
+            self.bcets = [self.toTicks(task.bcet, math.floor) for task in tasks]
 
         self.statusTable = [[float(0.0) for x in range(5)]
                             for y in range(self.n)]
@@ -37,12 +152,31 @@ class eventSimulator:
         # 4. flag to determine starting time of a job
 
         self.eventList = []  # List of events the simulator has to process
+        self.eventTime = 0  # time of the last processed event
+        self.eventCounter = 0  # tie-breaker (heap engine)
 
         # # Sorting:
         # tasks = sorted(tasks, key=operator.attrgetter('priority'))
 
+        # Periodicity detection.
+        if hyperperiod is not None:
+            # next hyperperiod boundary to check for idle processor
+            self.nextBoundary = (max(self.phases) if boundary is None
+                                 else self.toTicks(boundary))
+        self.idleBoundary = None  # last boundary with idle processor
+        self.steadyState = None  # start of the repeating schedule
+
         # Analysis result.
         self.raw_result = dict()
+        self.records = []  # per task (jobs x 2) array of start and finish
+        self.jobCount = None  # per task number of finished jobs in records
+
+        # Statistics.
+        self.releaseTimes = [0] * self.n  # release of the current job
+        self.responseTimes = [[] for y in range(self.n)]  # observed per job
+        self.maxResponseTimes = [0] * self.n  # maximum observed per task
+        self.busyStart = None  # start of the current busy period
+        self.busyPeriods = []  # lengths of the finished busy periods
 
         # Fill statusTable, raw_result and eventList the first time.
         self.initState()
@@ -50,17 +184,32 @@ class eventSimulator:
     class eventClass(object):
         """One Event."""
 
-        def __init__(self, case, delta, idx, bcet):
+        def __init__(self, case, delta, idx, bcet, time=None, seq=None):
             """Initialize the event.
 
-            case = 0 is a release and case = 1 is a deadline.
+            case = 0 is a release, case = 1 is a deadline, case = 2 is the
+            start of a blocking interval and case = 3 is a hyperperiod
+            boundary.
             delta is the remaining time until the event.
-            idx is the corresponding task index for that event.
+            idx is the corresponding task index for that event (for case = 2
+            the index of the blocking interval).
+            time and seq are the absolute time of the event and its insertion
+            number (only used by the heap engine).
             """
             self.eventType = case
             self.delta = delta
             self.idx = idx
             self.bcet = bcet
+            self.time = time
+            self.seq = seq
+
+        def __lt__(self, other):
+            """Order of events in the heap engine.
+
+            Events at the same time are processed in insertion order, which
+            is the order the stable sort of the list engine produces.
+            """
+            return (self.time, self.seq) < (other.time, other.seq)
 
         def case(self):
             """Return the case of that event."""
@@ -68,15 +217,26 @@ class eventSimulator:
                 return "release"
             elif self.eventType == 1:
                 return "deadline"
+            elif self.eventType == 2:
+                return "blocking"
+            elif self.eventType == 3:
+                return "boundary"
 
         def updateDelta(self, elapsedTime):
             """Update remaining time until the event."""
             self.delta = self.delta - elapsedTime
 
+    def toTicks(self, value, rounding=round):
+        """Convert a time value to ticks if scale is given."""
+        if self.scale is None or value is None:
+            return value
+        return to_ticks(value, self.scale, rounding)
+
     def tableReport(self):
         """Print eventList and statusTable."""
         # Print eventList.
-        for i, e in enumerate(self.eventList):
+        for i, e in enumerate(sorted(self.eventList)
+                              if self.engine == 'heap' else self.eventList):
             print("Event " + str(i) + " from task " + str(e.idx))
             print(e.case())
             print(e.delta)
@@ -91,38 +251,66 @@ class eventSimulator:
         """Find active task with highest priority.
 
         Returns index of the task. If there is no active task, it returns -1.
+        The lowest set bit of readyMask is the first row with non-zero entry
+        at 0 = remaining workload.
         """
-        hidx = -1
-        # Find first row with non-zero entry at 0 = remaining workload
-        for i in range(self.n):
-            if self.statusTable[i][0] != 0:
-                hidx = i
-                break
-        return hidx
+        return (self.readyMask & -self.readyMask).bit_length() - 1
+
+    def addEvent(self, case, delta, idx):
+        """Add an event that happens delta time units after the last event.
+
+        The list engine only appends the event, the eventList has to be
+        sorted afterwards.
+        """
+        if self.engine == 'heap':
+            heapq.heappush(self.eventList, self.eventClass(
+                case, delta, idx, self.bcet,
+                time=self.eventTime + delta, seq=self.eventCounter))
+            self.eventCounter += 1
+        else:
+            self.eventList.append(self.eventClass(case, delta, idx, self.bcet))
 
     def release(self, idx):
         """Behavior at job release of task with index idx."""
         # Set deadline event.
-        self.eventList.append(self.eventClass(
-            1, self.tasks[idx].deadline, idx, self.bcet))
+        self.addEvent(1, self.deadlines[idx], idx)
 
         # Set next release event.
-        self.eventList.append(self.eventClass(
-            0, self.tasks[idx].period, idx, self.bcet))
+        self.addEvent(0, self.interArrivalTime(idx), idx)
 
         # Sort the eventList.
-        self.eventList = sorted(self.eventList,
-                                key=operator.attrgetter('delta'))
+        if self.engine == 'list':
+            self.eventList = sorted(self.eventList,
+                                    key=operator.attrgetter('delta'))
+
+        self.addWorkload(idx)
+
+    def interArrivalTime(self, idx):
+        """Return the time until the next release of task idx."""
+        task = self.tasks[idx]
+        if self.random is not None and task.release_pattern == 'sporadic':
+            return self.toTicks(self.random.uniform(task.min_iat, task.max_iat))
+        return self.periods[idx]
 
+    def addWorkload(self, idx):
+        """Add the workload of a newly released job of task idx."""
         # Add the workload to corresponding entry in statusTable.
         if self.bcet:
-            self.statusTable[idx][0] += float(self.tasks[idx].bcet)
+            self.statusTable[idx][0] += self.bcets[idx]
         else:
-            self.statusTable[idx][0] += float(self.tasks[idx].wcet)
+            self.statusTable[idx][0] += self.wcets[idx]
+        if self.statusTable[idx][0] != 0:
+            self.readyMask |= 1 << idx
 
         # Initialiue the flag to indicate the first execution.
         self.statusTable[idx][4] = 1
 
+        if self.statistics:
+            self.releaseTimes[idx] = self.eventTime
+            if self.busyStart is None and self.statusTable[idx][0] != 0:
+                # Case: Release starts a busy period.
+                self.busyStart = self.eventTime
+
         # Decide the highest priority task in the system.
         self.h = self.findTheHighestWithWorkload()
         if self.h == -1:
@@ -140,13 +328,37 @@ class eventSimulator:
             self.statusTable[idx][2] += 1
         self.statusTable[idx][3] += 1
 
+    def block(self, idx):
+        """Behavior at the start of the blocking interval with index idx."""
+        self.blocked += self.blocking[idx][1]
+        if self.statistics and self.busyStart is None:
+            # Case: Blocking starts a busy period.
+            self.busyStart = self.eventTime
+
+        # Set start of the next blocking interval.
+        if idx + 1 < len(self.blocking):
+            self.addEvent(2, self.blocking[idx + 1][0] - self.eventTime,
+                          idx + 1)
+            if self.engine == 'list':
+                self.eventList = sorted(self.eventList,
+                                        key=operator.attrgetter('delta'))
+
+    def boundary(self, idx):
+        """Behavior at a hyperperiod boundary (the periodicity is checked
+        before the events at the boundary are processed)."""
+        self.addEvent(3, self.hyperperiod, idx)
+        if self.engine == 'list':
+            self.eventList = sorted(self.eventList,
+                                    key=operator.attrgetter('delta'))
+
     def dispatcher(self, targetedNumber):
         """Main function of the scheduler.
 
         Stops when the number of released jobs of the lowest priority task is
-        equal to targetedNumber.
+        equal to targetedNumber or when the schedule starts to repeat.
         """
-        while (targetedNumber != self.numDeadlines(self.n - 1)):
+        while (targetedNumber != self.numDeadlines(self.n - 1)
+               and self.steadyState is None):
             if len(self.eventList) == 0:
                 print("BUG: there is no event in the dispatcher")
                 break
@@ -156,15 +368,50 @@ class eventSimulator:
                 # Process the event.
                 self.event_to_dispatch(e)
 
+    def dispatchUntil(self, end):
+        """Process all events until time end (in ticks if scale is given).
+
+        Stop condition for sporadic releases, where the number of jobs that
+        are released until end is not known beforehand.
+        """
+        while len(self.eventList) > 0 and self.nextEventTime() <= end:
+            self.event_to_dispatch(self.getNextEvent())
+
+    def nextEventTime(self):
+        """Return the time of the next event in the eventList."""
+        if self.engine == 'heap':
+            return self.eventList[0].time
+        return self.eventTime + self.eventList[0].delta
+
+    def advance(self, recorder, idx, nmb):
+        """Dispatch events until the nmb-th job of task idx is finished in
+        the records of recorder (this simulator or a companion simulator) or
+        until the schedule repeats.
+
+        Needs recording = 'array'.
+        """
+        while (recorder.jobCount[idx] <= nmb and self.steadyState is None
+               and len(self.eventList) > 0):
+            self.event_to_dispatch(self.getNextEvent())
+
     def event_to_dispatch(self, event):
         """Process the given event."""
         # Process the elapsed time until the event.
         self.elapsedTime(event)
 
+        # Check for periodicity of the schedule.
+        if self.hyperperiod is not None:
+            self.checkPeriodicity()
+            if self.steadyState is not None:
+                # Simulation is complete, the event is not processed anymore.
+                return
+
         # Find the corresponding function for the event.
         switcher = {
             0: self.release,
             1: self.deadline,
+            2: self.block,
+            3: self.boundary,
         }
         func = switcher.get(event.eventType, lambda: "ERROR")
 
@@ -173,19 +420,69 @@ class eventSimulator:
 
     def elapsedTime(self, event):
         """Process the elapsed time until the event."""
-        # Determine the elapsed time until the event.
-        delta = event.delta
+        if self.engine == 'heap':
+            # Determine the elapsed time from the absolute event times.
+            delta = event.time - self.eventTime
+            self.eventTime = event.time
+        else:
+            # Determine the elapsed time until the event.
+            delta = event.delta
+            self.eventTime += delta
 
-        # Update deltas of remaining events in eventList.
-        for e in self.eventList:
-            e.updateDelta(delta)
+            # Update deltas of remaining events in eventList.
+            for e in self.eventList:
+                e.updateDelta(delta)
 
+        self.execute(delta)
+
+    def isIdle(self):
+        """Check whether no job has remaining workload."""
+        return self.readyMask == 0 and self.blocked == 0
+
+    def checkPeriodicity(self):
+        """Check for idle processor at the current hyperperiod boundary.
+
+        Has to be called before the events at the boundary are processed.
+        """
+        if self.eventTime < self.nextBoundary:
+            return
+        if self.eventTime > self.nextBoundary:
+            # Case: No event at the boundary, the processor may have been
+            # busy at the boundary.
+            self.idleBoundary = None
+        elif self.isIdle():
+            if (self.idleBoundary == self.eventTime - self.hyperperiod
+                    and not self.missedDeadlines()):
+                # Two consecutive idle boundaries: schedule repeats.
+                self.steadyState = self.idleBoundary
+            self.idleBoundary = self.eventTime
+        while self.nextBoundary <= self.eventTime:
+            self.nextBoundary += self.hyperperiod
+
+    def execute(self, delta):
+        """Execute the active jobs for delta time units."""
         # Update the workloads in statusTable.
         while (delta):
+            if self.blocked:
+                # Case: Processor is blocked by tasks that are not simulated.
+                if delta >= self.blocked:
+                    delta -= self.blocked
+                    self.systemTick += self.blocked
+                    self.blocked = 0
+                else:
+                    self.blocked -= delta
+                    self.systemTick += delta
+                    delta = 0
+                continue
+
             self.h = self.findTheHighestWithWorkload()
 
             if self.h == -1:
                 # Case: Processor idles for the remaining time.
+                if self.statistics and self.busyStart is not None:
+                    # Busy period ends.
+                    self.busyPeriods.append(self.systemTick - self.busyStart)
+                    self.busyStart = None
                 self.systemTick += delta
                 delta = 0
 
@@ -194,8 +491,8 @@ class eventSimulator:
 
                 if self.statusTable[self.h][4] == 1:
                     # Case: First time execution of task hidx
-                    # Put start of the job to raw_result.
-                    self.raw_result[self.tasks[self.h].id].append(self.systemTick)
+                    # Put start of the job to the result.
+                    self.recordStart(self.h)
                     # Set flag to 0.
                     self.statusTable[self.h][4] = 0
 
@@ -204,17 +501,18 @@ class eventSimulator:
                 self.systemTick += self.statusTable[self.h][0]
                 # Set remaining workload to 0.
                 self.statusTable[self.h][0] = 0
+                self.readyMask &= ~(1 << self.h)
 
-                # Put finish of the job to raw_result.
-                self.raw_result[self.tasks[self.h].id].append(self.systemTick)
+                # Put finish of the job to the result.
+                self.recordFinish(self.h)
 
             elif delta < self.statusTable[self.h][0]:
                 # Case: Task with index h finishes not during remaining time.
 
                 if self.statusTable[self.h][4] == 1:
                     # Case: First time execution of task hidx
-                    # Put start of the job to raw_result.
-                    self.raw_result[self.tasks[self.h].id].append(self.systemTick)
+                    # Put start of the job to the result.
+                    self.recordStart(self.h)
                     # Set flag to 0.
                     self.statusTable[self.h][4] = 0
 
@@ -224,8 +522,35 @@ class eventSimulator:
                 self.systemTick += delta
                 delta = 0
 
+    def recordStart(self, idx):
+        """Record systemTick as start of the current job of task idx."""
+        if self.recording == 'array':
+            nmb = self.jobCount[idx]
+            if nmb == len(self.records[idx]):
+                # Capacity exceeded: double the array.
+                self.records[idx] = np.concatenate(
+                    (self.records[idx], np.empty_like(self.records[idx])))
+            self.records[idx][nmb, 0] = self.systemTick
+        else:
+            self.raw_result[self.tasks[idx].id].append(self.systemTick)
+
+    def recordFinish(self, idx):
+        """Record systemTick as finish of the current job of task idx."""
+        if self.statistics:
+            response_time = self.systemTick - self.releaseTimes[idx]
+            self.responseTimes[idx].append(response_time)
+            if response_time > self.maxResponseTimes[idx]:
+                self.maxResponseTimes[idx] = response_time
+        if self.recording == 'array':
+            self.records[idx][self.jobCount[idx], 1] = self.systemTick
+            self.jobCount[idx] += 1
+        else:
+            self.raw_result[self.tasks[idx].id].append(self.systemTick)
+
     def getNextEvent(self):
         """Get the next event from eventList."""
+        if self.engine == 'heap':
+            return heapq.heappop(self.eventList)
         event = self.eventList.pop(0)
         return event
 
@@ -237,7 +562,13 @@ class eventSimulator:
         of each job).
         Note: The scheduler returns an empty list for a task if it has
         execution time = 0.
+        With recording = 'array', the recorded arrays are converted to the
+        same format (see job_arrays for the arrays themselves).
         """
+        if self.recording == 'array':
+            return {task_id: list(map(tuple, jobs.tolist()))
+                    for task_id, jobs in self.job_arrays().items()}
+
         # Initialize result dictionary.
         result = dict()
         for task in self.tasks:
@@ -260,6 +591,30 @@ class eventSimulator:
 
         return result
 
+    def job_arrays(self):
+        """Return the finished jobs of each task as (jobs x 2) NumPy array
+        (recording = 'array')."""
+        # Only finished jobs are part of the result.
+        return {task.id: self.records[idx][:self.jobCount[idx]].copy()
+                for idx, task in enumerate(self.tasks)}
+
+    def responseTimeResult(self):
+        """Return the observed response times (statistics = True).
+
+        result[task.id] is a NumPy array with the response time of each
+        finished job.
+        """
+        return {task.id: np.array(self.responseTimes[idx])
+                for idx, task in enumerate(self.tasks)}
+
+    def maxResponseTime(self, idx):
+        """Return the maximum observed response time of idx task."""
+        return self.maxResponseTimes[idx]
+
+    def busyPeriodLengths(self):
+        """Return the lengths of all finished busy periods as NumPy array."""
+        return np.array(self.busyPeriods)
+
     def missRate(self, idx):
         """Return the miss rate of task idx."""
         return self.statusTable[idx][2] / self.statusTable[idx][1]
@@ -273,6 +628,10 @@ class eventSimulator:
             sumMisses += self.statusTable[idx][2]
         return sumMisses / sumRelease
 
+    def missedDeadlines(self):
+        """Return whether any job missed its deadline so far."""
+        return any(self.statusTable[idx][2] for idx in range(self.n))
+
     def releasedJobs(self, idx):
         """Return the number of released jobs of idx task in the table."""
         return self.statusTable[idx][1]
@@ -291,19 +650,93 @@ class eventSimulator:
 
     def initState(self):
         """Specify the initial state of the simulator."""
-        # Make one entry for each task in the result dictionary.
-        for task in self.tasks:
-            self.raw_result[task.id] = []
+        if self.recording == 'array':
+            # Preallocate one array for each task.
+            for task in self.tasks:
+                capacity = 16
+                if self.horizon is not None:
+                    # sporadic jobs are released at least min_iat apart
+                    distance = (task.min_iat if self.random is not None
+                                and task.release_pattern == 'sporadic'
+                                else task.period)
+                    capacity = max(capacity, int(math.ceil(
+                        (self.horizon - task.phase) / distance)) + 1)
+                self.records.append(np.empty(
+                    (capacity, 2),
+                    dtype=float if self.scale is None else np.int64))
+            self.jobCount = np.zeros(self.n, dtype=np.int64)
+        else:
+            # Make one entry for each task in the result dictionary.
+            for task in self.tasks:
+                self.raw_result[task.id] = []
 
         for idx in range(len(self.tasks)):
             # Fill the status Table.
             self.statusTable[idx][0] = 0
             self.statusTable[idx][3] = self.statusTable[idx][1]
             # Put release events to the eventList.
-            self.eventList.append(self.eventClass(
-                0, self.tasks[idx].phase, idx, self.bcet))
+            self.addEvent(0, self.phases[idx], idx)
+
+        # Put start of the first blocking interval to the eventList.
+        if len(self.blocking) > 0:
+            self.addEvent(2, self.blocking[0][0], 0)
+
+        # Put the first hyperperiod boundary to the eventList (there is not
+        # necessarily a release of the simulated tasks at the boundary).
+        if self.hyperperiod is not None:
+            self.addEvent(3, self.nextBoundary, 0)
 
         # Sort eventList by remaining time.
         # In case phase not 0 anymore, we need this one.
-        self.eventList = sorted(
-            self.eventList, key=operator.attrgetter('delta'))
+        if self.engine == 'list':
+            self.eventList = sorted(
+                self.eventList, key=operator.attrgetter('delta'))
+
+
+class jointEventSimulator(eventSimulator):
+    """Event simulator that creates the wcet and the bcet schedule in one pass.
+
+    Release and deadline events are processed only once. The execution with
+    wcet is tracked by this simulator, the execution with bcet by a companion
+    simulator that does not process events on its own.
+    """
+
+    def __init__(self, tasks, engine='heap', recording='list', horizon=None,
+                 hyperperiod=None, statistics=False, seed=None, scale=None):
+        """Initialize the joint event simulator."""
+        self.bcetSimulator = eventSimulator(
+            tasks, True, engine, recording, horizon, statistics=statistics,
+            scale=scale)
+        self.bcetSimulator.eventList = []  # events are processed here
+        super().__init__(tasks, False, engine, recording, horizon,
+                         hyperperiod, statistics=statistics, seed=seed,
+                         scale=scale)
+
+    def addWorkload(self, idx):
+        """Add the workload of a newly released job to both executions."""
+        super().addWorkload(idx)
+        self.bcetSimulator.addWorkload(idx)
+
+    def deadline(self, idx):
+        """Behavior at job deadline for both executions."""
+        super().deadline(idx)
+        self.bcetSimulator.deadline(idx)
+
+    def missedDeadlines(self):
+        """Return whether any job of both executions missed its deadline."""
+        return super().missedDeadlines() or self.bcetSimulator.missedDeadlines()
+
+    def isIdle(self):
+        """Check whether no job of both executions has remaining workload."""
+        return super().isIdle() and self.bcetSimulator.isIdle()
+
+    def execute(self, delta):
+        """Execute the active jobs of both executions for delta time units."""
+        self.bcetSimulator.eventTime = self.eventTime
+        super().execute(delta)
+        self.bcetSimulator.execute(delta)
+
+    def schedules(self):
+        """Return the wcet and the bcet schedule in the format of e2e_result."""
+        return {'wcet': self.e2e_result(),
+                'bcet': self.bcetSimulator.e2e_result()}
@@ -0,0 +1,119 @@
+"""
+Utility file for the simulation of sporadic task sets
+
+Many independent simulation replicas with random inter-arrival times are
+executed in parallel. The worst observed response times and end-to-end
+latencies (and the schedule in which they are observed) can be compared to
+the results of the analyses for sporadic tasks (e.g., duerr19, hamann17,
+guenzel23_mix).
+"""
+
+import random
+import numpy as np
+import utilities.event_simulator as es
+import utilities.parallel as parallel
+
+
+def observed_data_age(chain, schedule):
+    """Return the maximum reduced data age of chain that is observed in schedule
+    (task.id -> (jobs x 2) array, see eventSimulator.job_arrays()).
+
+    Implicit communication: jobs read at their start and write at their finish.
+    For each job of the last task, the immediate backward job chain is
+    constructed and its length is finish of the last job minus start of the
+    first job. Incomplete job chains (at the beginning of the schedule) are
+    ignored. Returns 0 if there is no complete job chain."""
+
+    jobs = schedule[chain[-1].id]
+    read = jobs[:, 0]  # read-event of the current job in the backward chain
+    complete = np.ones(len(jobs), dtype=bool)
+
+    for task in chain[-2::-1]:
+        producer_jobs = schedule[task.id]
+        # latest job of task that finishes until the read-event
+        producer = np.searchsorted(producer_jobs[:, 1], read, side='right') - 1
+        complete &= producer >= 0
+        read = producer_jobs[np.maximum(producer, 0), 0]
+
+    lengths = jobs[complete, 1] - read[complete]
+    return lengths.max() if len(lengths) > 0 else 0
+
+
+def simulate(task_set, duration, seed):
+    """Return the eventSimulator that simulated task_set for duration with
+    sporadic releases drawn with seed."""
+
+    simulator = es.eventSimulator(
+        task_set, False, recording='array', horizon=duration,
+        statistics=True, seed=seed)
+
+    # Stop condition: time (with sporadic releases, the number of jobs of
+    # the lowest priority task in duration is not fixed).
+    simulator.dispatchUntil(duration)
+
+    return simulator
+
+
+def simulate_replica(task_set, ce_chains, duration, seed):
+    """Simulate task_set for duration with sporadic releases drawn with seed.
+    Returns the maximum observed response time of each task and the observed
+    latency of each cause-effect chain."""
+
+    simulator = simulate(task_set, duration, seed)
+
+    schedule = simulator.job_arrays()
+    response_times = [simulator.maxResponseTime(idx) for idx in range(len(task_set))]
+    latencies = [observed_data_age(chain, schedule) for chain in ce_chains]
+
+    return (response_times, latencies)
+
+
+def replica_schedule(task_set, duration, seed):
+    """Return the schedule of the replica of simulate_replica with seed
+    (format of eventSimulator.e2e_result())."""
+
+    return simulate(task_set, duration, seed).e2e_result()
+
+
+def simulate_sporadic(task_set, ce_chains, number_of_replicas, duration, number_of_threads, executor=None):
+    """Parallelizes the simulation of number_of_replicas independent replicas of
+    task_set with sporadic releases (with the workers of executor if given).
+
+    Returns a dictionary with
+    - 'response_times': task.id -> worst observed response time over all replicas
+    - 'latencies': worst observed latency of each cause-effect chain over all replicas
+    - 'schedule': schedule of the replica with the worst observed latency of
+      the cause-effect chains (without chains, with the worst observed response
+      time of the lowest priority task) in the format of eventSimulator.e2e_result()
+    """
+
+    # generate seeds outside of worker threads to avoid duplicate random numbers
+    seeds = [random.randint(0, 2**32 - 1) for _ in range(number_of_replicas)]
+
+    with parallel.pool(number_of_threads, executor) as pool:
+        results = pool.starmap(
+            simulate_replica,
+            zip(
+                [task_set] * number_of_replicas,
+                [ce_chains] * number_of_replicas,
+                [duration] * number_of_replicas,
+                seeds
+            )
+        )
+
+        # The schedules are not sent back for all replicas. Instead, the
+        # worst replica is simulated again with its seed.
+        if len(ce_chains) > 0:
+            worst = int(np.argmax([max(result[1]) for result in results]))
+        else:
+            worst = int(np.argmax([result[0][-1] for result in results]))
+        schedule = pool.apply(replica_schedule, (task_set, duration, seeds[worst]))
+
+    response_times = np.max([result[0] for result in results], axis=0)
+    latencies = np.max([result[1] for result in results], axis=0)
+
+    return {
+        'response_times': {task.id: response_time for task, response_time in zip(task_set, response_times.tolist())},
+        'latencies': latencies.tolist(),
+        'schedule': schedule
+    }
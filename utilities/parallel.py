@@ -0,0 +1,132 @@
+"""
+Utility file for the parallel execution on lists of task sets or cause-effect chains
+
+The list is handed to each worker only once (inherited without pickling if
+the processes are forked). The tasks that are sent to the workers only
+consist of a function and an index into the list, so that a task set with its
+schedules is not pickled again for every chain.
+
+An Executor keeps one pool of workers for a whole evaluation. Lists that are
+shared with it stay in the memory of the workers until they are replaced,
+so that each stage only sends function references and indices.
+"""
+
+import contextlib
+import multiprocessing
+from multiprocessing import Pool
+
+
+_shared = dict()  # lists shared with the workers (by name)
+_barrier = None  # synchronizes the workers of an Executor while sharing
+
+
+def _init_worker(shared, barrier=None):
+    global _barrier
+    _shared.update(shared)
+    _barrier = barrier
+
+
+def _share(name, items):
+    _shared[name] = items
+    # wait until all workers have a copy (each worker receives exactly one)
+    _barrier.wait()
+
+
+def _call(function, name, idx):
+    return function(_shared[name][idx])
+
+
+def _star_call(function, name, idx):
+    return function(*_shared[name][idx])
+
+
+def _indexed_call(args):
+    function, name, idx, star = args
+    item = _shared[name][idx]
+    return idx, function(*item) if star else function(item)
+
+
+class Executor:
+    """Pool of worker processes that is started once per evaluation."""
+
+    def __init__(self, number_of_threads):
+        self.number_of_threads = number_of_threads
+        self.pool = Pool(number_of_threads, initializer=_init_worker,
+                         initargs=(dict(), multiprocessing.Barrier(number_of_threads)))
+        self.shared = dict()  # lists shared with the workers (by name)
+
+    def share(self, name, items):
+        """Send items to all workers (once per worker). Items have to be shared
+        again if they are changed afterwards. Schedules from the cache are only
+        sent as references to the cache entries (see cache.CachedSchedule)."""
+        self.pool.starmap(_share, [(name, items)] * self.number_of_threads, chunksize=1)
+        self.shared[name] = items
+
+    def map(self, function, name, star=False):
+        """Return [function(item) for item in the list shared as name]
+        (function(*item) if star)."""
+        return self.pool.starmap(_star_call if star else _call,
+                                 [(function, name, idx) for idx in range(len(self.shared[name]))])
+
+    def imap(self, function, name, star=False):
+        """Yield (idx, function(item)) for the list shared as name in the order
+        in which the results are completed."""
+        return self.pool.imap_unordered(
+            _indexed_call, ((function, name, idx, star) for idx in range(len(self.shared[name]))))
+
+    def close(self):
+        self.pool.close()
+        self.pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def map_indexed(function, items, number_of_threads, star=False, executor=None, name='items'):
+    """Return [function(item) for item in items] (function(*item) if star)
+    computed with number_of_threads worker processes (or the workers of executor,
+    where items are shared as name)."""
+
+    if len(items) == 0:
+        return []
+
+    if executor is not None:
+        executor.share(name, items)
+        return executor.map(function, name, star)
+
+    with Pool(number_of_threads, initializer=_init_worker, initargs=({name: items},)) as pool:
+        return pool.starmap(_star_call if star else _call,
+                            [(function, name, idx) for idx in range(len(items))])
+
+
+def imap_indexed(function, items, number_of_threads, star=False, executor=None, name='items'):
+    """Yield (idx, function(item)) for the items (function(*item) if star) in the
+    order in which they are completed by number_of_threads worker processes
+    (or by the workers of executor, where items are shared as name)."""
+
+    if len(items) == 0:
+        return
+
+    if executor is not None:
+        executor.share(name, items)
+        yield from executor.imap(function, name, star)
+        return
+
+    with Pool(number_of_threads, initializer=_init_worker, initargs=({name: items},)) as pool:
+        yield from pool.imap_unordered(
+            _indexed_call, ((function, name, idx, star) for idx in range(len(items))))
+
+
+@contextlib.contextmanager
+def pool(number_of_threads, executor=None):
+    """Context manager for a new pool with number_of_threads workers, or for
+    the pool of executor (which stays open afterwards)."""
+
+    if executor is not None:
+        yield executor.pool
+    else:
+        with Pool(number_of_threads) as new_pool:
+            yield new_pool
@@ -5,9 +5,11 @@ Utility file for analysis methods that need a schedule
 """
 
 import math
-from multiprocessing import Pool
+import numpy as np
 from e2eAnalyses.Davare2007 import davare07
 import utilities.event_simulator as es
+import utilities.cache as cache
+import utilities.parallel as parallel
 
 
 
@@ -23,88 +25,293 @@ def flattened_cec_tuple_list(cecs):
         return cecs
 
 
+def closed_form_task(task):
+    """Return whether the jobs of task are constructed in closed form instead
+    of being simulated: tasks without execution time (which the simulator
+    cannot handle) and LET tasks (read at release, write at deadline)."""
+    return task.wcet == 0 or task.communication_policy == 'LET'
+
+
+def closed_form_jobs(task, end, scale=None):
+    """Return the (start, finish) of all jobs of task released until end as
+    (jobs x 2) array, aligned with the releases of the task.
+    Jobs of LET tasks finish at their deadline, all other jobs at their release.
+    With scale, the entries are integer ticks of length 1/scale."""
+    number = max(int(math.floor((end - task.phase) / task.period)) + 1, 0)
+    releases = task.phase + task.period * np.arange(number, dtype=float)
+    if task.communication_policy == 'LET':
+        jobs = np.column_stack((releases, releases + task.deadline))
+    else:
+        jobs = np.column_stack((releases, releases))
+    if scale is not None:
+        jobs = np.rint(jobs * scale).astype(np.int64)
+    return jobs
+
+
+def job_list(jobs):
+    """Return the (jobs x 2) array jobs as list of (start, finish) tuples, the
+    format of eventSimulator.e2e_result() (indexing plain Python values is
+    much faster than indexing array rows)."""
+    return list(map(tuple, jobs.tolist()))
+
+
+def add_closed_form_jobs(task_set, schedules, end, scale=None):
+    """Set the jobs of all closed form tasks of task_set in the wcet and bcet
+    schedules (replacing the simulated jobs of LET tasks)."""
+    for task in task_set:
+        if closed_form_task(task):
+            jobs = job_list(closed_form_jobs(task, end, scale))
+            schedules['wcet'][task.id] = jobs
+            schedules['bcet'][task.id] = jobs
+
+
+def steady_state_end(task_set):
+    """Return the end of the jobs that are kept in the schedules of task_set.
+    The schedule repeats every hyperperiod from max_phase + hyperperiod on, so
+    the jobs released until max_phase + 2 * hyperperiod are enough to obtain
+    all later jobs by shifting (as done by the Schedule_Analyzer)."""
+    return task_set.max_phase() + 2 * task_set.hyperperiod()
+
+
+def repeating_end(simulator):
+    """Return the end of the first hyperperiod from which on the schedule of
+    simulator repeats (in time units), or None if the simulation did not
+    detect a repetition (e.g., with deadline misses or overload). Jobs
+    released until then are enough to obtain all later jobs by shifting."""
+    if simulator.steadyState is None:
+        return None
+    end = simulator.steadyState + simulator.hyperperiod
+    return end if simulator.scale is None else end / simulator.scale
+
+
+def truncate_schedule(schedule, tasks, end):
+    """Remove the jobs of tasks that are released at or after end from the
+    job lists of schedule (end in time units)."""
+    for task in tasks:
+        del schedule[task.id][max(int(math.ceil((end - task.phase) / task.period)), 0):]
+
+
+class TickSchedule(dict):
+    """Schedule (task id -> jobs) whose entries are integer ticks of length
+    1/scale, as recorded by an eventSimulator with a scale."""
+
+    def __init__(self, schedule, scale):
+        super().__init__(schedule)
+        self.scale = scale
+
+
+def time_scale(schedule):
+    """Return the number of schedule entries per time unit (1 unless the
+    schedule is given in ticks)."""
+    return getattr(schedule, 'scale', None) or 1
+
+
+class LazySchedule(dict):
+    """Schedule of a task set that is simulated on demand.
+
+    Behaves like the dictionary returned by eventSimulator.e2e_result(), but
+    the entries of the simulated tasks are LazyJobLists: the simulator is
+    only advanced as far as the highest requested job and the simulated jobs
+    are kept. Jobs that are known without simulation (closed form tasks)
+    replace the LazyJobList of their task.
+    """
+
+    def __init__(self, simulator, recorder, hyperperiod):
+        # one job list per simulated task, kept between the lookups
+        super().__init__((task.id, LazyJobList(self, idx)) for idx, task in enumerate(simulator.tasks))
+        self.simulator = simulator  # simulator that processes the events
+        self.recorder = recorder  # simulator that records the schedule
+        self.hyperperiod = hyperperiod
+        self.scale = simulator.scale  # entries are ticks if not None
+
+    def advance(self, idx, nmb):
+        """Simulate until the nmb-th job of the task with index idx is known."""
+        self.simulator.advance(self.recorder, idx, nmb)
+
+
+class LazyJobList():
+    """Jobs of one task in a LazySchedule.
+    The recorded jobs are copied as (start, finish) tuples when the list is
+    extended, so that lookups of known jobs do not touch the simulator."""
+
+    def __init__(self, schedule, idx):
+        self.schedule = schedule
+        self.idx = idx
+        self.jobs = []
+
+    def extend_to(self, nmb):
+        """Simulate until the nmb-th job is known or the schedule repeats
+        (later jobs are obtained by shifting, see Schedule_Analyzer)."""
+        if nmb < len(self.jobs):
+            return
+        self.schedule.advance(self.idx, nmb)
+        recorder = self.schedule.recorder
+        self.jobs.extend(job_list(
+            recorder.records[self.idx][len(self.jobs):recorder.jobCount[self.idx]]))
+
+    def __len__(self):
+        return len(self.jobs)
+
+    def __getitem__(self, nmb):
+        return self.jobs[nmb]
+
+
+def lazy_schedules(task_set, ticks=False, ce_chains=None):
+    """Return the schedules of task_set in the format of schedule_task_set,
+    but simulated on demand.
+    If ce_chains are given, only the tasks down to the lowest priority task of
+    the ce_chains are simulated."""
+
+    separate_bcet = task_set[0].bcet != task_set[0].wcet
+    hyper_period = task_set.hyperperiod()
+    scale = es.tick_scale(task_set) if ticks else None
+    # closed form jobs until the schedule repeats (enough for shifting)
+    end = steady_state_end(task_set)
+
+    tasks = chain_priority_levels(ce_chains, task_set) if ce_chains else task_set
+
+    # tasks without execution time do not interfere with the other tasks
+    simulated = [task for task in tasks if task.wcet > 0]
+    if len(simulated) == 0:
+        schedules = {'wcet': dict()}
+        schedules['bcet'] = schedules['wcet']
+        add_closed_form_jobs(tasks, schedules, end, scale)
+        if ticks:
+            schedules['wcet'] = schedules['bcet'] = TickSchedule(schedules['wcet'], scale)
+        return schedules
+
+    if separate_bcet:
+        simulator = es.jointEventSimulator(
+            simulated, recording='array', hyperperiod=hyper_period,
+            scale=scale)
+        recorder_bcet = simulator.bcetSimulator
+    else:
+        simulator = es.eventSimulator(
+            simulated, False, recording='array', hyperperiod=hyper_period,
+            scale=scale)
+        recorder_bcet = simulator
+
+    schedules = dict()
+    schedules['wcet'] = LazySchedule(simulator, simulator, hyper_period)
+    schedules['bcet'] = LazySchedule(simulator, recorder_bcet, hyper_period)
+    add_closed_form_jobs(tasks, schedules, end, scale)
+    return schedules
+
+
+class ShiftedJobLists(dict):
+    """Job lists of a schedule (task id -> jobs) as used by the analyzers.
+
+    The schedules only contain the jobs until the schedule repeats. When a
+    later job of a task is requested, a copy of its job list is extended by
+    shifting its last hyperperiod and kept for the following lookups (the
+    schedule itself is not changed). The job lists of the schedule can also
+    be (jobs x 2) arrays (e.g., memory-mapped from the cache), the extended
+    copies are lists of (start, finish) tuples.
+    """
+
+    def __init__(self, schedule, hyperperiod, shift):
+        super().__init__()
+        self.schedule = schedule
+        self.hyperperiod = hyperperiod
+        self.shift = shift  # hyperperiod in the time base of the schedule
+
+    def __missing__(self, task_id):
+        jobs = self[task_id] = self.schedule[task_id]
+        return jobs
+
+    def extend(self, task, nmb):
+        """Return the job list of task, extended until the nmb-th job is known."""
+        lst = self[task.id]
+        if isinstance(lst, LazyJobList):
+            # simulate until the entry is known or the schedule repeats
+            lst.extend_to(nmb)
+            if nmb < len(lst):
+                return lst
+            lst = lst.jobs
+
+        div, rem = divmod(self.hyperperiod, task.period)
+        assert rem == 0
+        if len(lst) < div:  # Case: no complete hyperperiod is recorded
+            raise IndexError('hyperperiod of task not recorded')
+
+        # extend at least to twice the length to reduce the number of copies
+        jobs = job_list(lst) if isinstance(lst, np.ndarray) else list(lst)
+        shift = self.shift
+        for idx in range(len(jobs), max(nmb + 1, 2 * len(jobs))):
+            start, finish = jobs[idx - div]
+            jobs.append((start + shift, finish + shift))
+        self[task.id] = jobs
+        return jobs
+
+
 class Schedule_Analyzer():
     def __init__(self, schedule, hyperperiod):
-        self.schedule = schedule
         self.hyperperiod = hyperperiod
+        # entries of tick schedules are converted only when they are returned
+        self.scale = time_scale(schedule)
+        self.ticks = self.scale != 1
+        self.shift = es.to_ticks(hyperperiod, self.scale)
+        self.schedule = ShiftedJobLists(schedule, hyperperiod, self.shift)
 
     def _get_entry(self, nmb, lst, tsk):
         '''get nmb-th entry of the list lst with task tsk.'''
         if nmb < 0:
-        # Case: index too low, has to be made larger
+        # Case: index too low
             return (0,0)
-            # check some hyperperiods later
-            # make new_nmb an integer value
-            new_nmb = nmb
-            counter = 0
-            while new_nmb < len(lst):
-                div, rem = divmod(self.hyperperiod, tsk.period)
-                assert rem == 0
-                new_nmb = new_nmb + div
-                counter += 1
-            # add counter hyperperiods
-            # TODO this is not very efficient since we need the values several times.
-            return [self.hyperperiod * counter + entry for entry in lst[new_nmb]]
-        # Case: index too high, has to be made smaller 
-        # TODO not sure if this is a good idea since the last entries could be wrong depending on the implementation of the scheduler ...
-        elif nmb >= len(lst):
-            # check some hyperperiods earlier
-            # make new_nmb an integer value
-            new_nmb = nmb
-            counter = 0
-            while new_nmb >= len(lst):
-                div, rem = divmod(self.hyperperiod, tsk.period)
-                assert rem == 0
-                new_nmb = new_nmb - div
-                counter += 1
-            # add counter hyperperiods
-            # TODO this is not very efficient since we need the values several times.
-            return [self.hyperperiod * counter + entry for entry in lst[new_nmb]]
-        else:  # Case: entry can be used
-            try:
-                return lst[nmb]
-            except:
-                breakpoint()
+
+        if nmb < len(lst):  # Case: entry is known
+            return lst[nmb]
+
+        # Case: index too high, the job list is extended by shifting
+        return self.schedule.extend(tsk, nmb)[nmb]
 
     def start(self, task, nmb):
         '''returns the upper bound on read-event of the nbm-th job of a task.'''
         lst = self.schedule[task.id]  # list that has the read-even minimum
-        # choose read-event from list
-        return self._get_entry(nmb, lst, task)[0]
+        # choose read-event from list (known entries are used directly)
+        entry = lst[nmb][0] if 0 <= nmb < len(lst) else self._get_entry(nmb, lst, task)[0]
+        return entry / self.scale if self.ticks else entry
 
     def finish(self, task, nmb):
         '''returns the upper bound on read-event of the nbm-th job of a task.'''
         lst = self.schedule[task.id]  # list that has the write-even minimum
-        # choose write-event from list
-        return self._get_entry(nmb, lst, task)[1]
+        # choose write-event from list (known entries are used directly)
+        entry = lst[nmb][1] if 0 <= nmb < len(lst) else self._get_entry(nmb, lst, task)[1]
+        return entry / self.scale if self.ticks else entry
 
 
 #####
 # Schedule construction
 #####
 
-def schedule_task_set(ce_chains, task_set):
-    """Return the schedules of some task_set.
-    ce_chains is a list of ce_chains that will be computed later on.
-    We need this to compute latency_upper_bound to determine the additional simulation time at the end.
-    Note:
-    - In case of error, None is returned."""
+schedule_engines = ['simulation', 'analytic']  # possible engines of schedule_task_set
 
-    separate_bcet = task_set[0].bcet != task_set[0].wcet
+def chain_priority_levels(ce_chains, task_set):
+    """Return the tasks of task_set down to the lowest priority task of the ce_chains.
+    Under preemptive fixed-priority scheduling, the jobs of lower priority tasks
+    do not affect the jobs of these tasks."""
+
+    lowest = max((task_set.index(task) for ce in ce_chains for task in ce),
+                 default=len(task_set) - 1)
+    return task_set[:lowest + 1]
+
+
+def simulation_interval(ce_chains, task_set, tasks=None):
+    """Return the interval that has to be simulated for the ce_chains and the
+    time until which the simulation runs at the latest.
+    If tasks is given, only these tasks of task_set are simulated."""
+
+    if tasks is None:
+        tasks = task_set
 
-    # try:
     # Preliminary: compute latency_upper_bound
     latency_upper_bound = max([davare07(ce) for ce in ce_chains])
 
-    # Main part: Simulation part for wcet/bcet taskset
-    simulator_wcet = es.eventSimulator(task_set, False)
-    if separate_bcet:
-        simulator_bcet = es.eventSimulator(task_set, True)
-
     # Determination of the variables used to compute the stop
     # condition of the simulation
-    max_phase = max(task_set, key=lambda task: task.phase).phase
-    max_period = max(task_set, key=lambda task: task.period).period
+    max_phase = max(tasks, key=lambda task: task.phase).phase
+    max_period = max(tasks, key=lambda task: task.period).period
+    # (the schedule is shifted by the hyperperiod of the whole task set)
     hyper_period = task_set.hyperperiod()
 
     sched_interval = (
@@ -114,18 +321,94 @@ def schedule_task_set(ce_chains, task_set):
         + max_period
     )  # for convenience
 
-    # Stop condition: Number of jobs of lowest priority task.
-    simulator_wcet.dispatcher(int(math.ceil(sched_interval / task_set[-1].period)))
-    if separate_bcet:
-        simulator_bcet.dispatcher(int(math.ceil(sched_interval / task_set[-1].period)))
+    # The simulation stops at the latest one period of the lowest priority
+    # task after sched_interval (used to preallocate the schedule arrays).
+    horizon = max_phase + sched_interval + max_period
 
-    # Simulation without early completion.
-    schedules = dict()
-    schedules['wcet'] = simulator_wcet.e2e_result()
-    if separate_bcet:
-        schedules['bcet'] = simulator_bcet.e2e_result()
-    else:
+    return sched_interval, horizon
+
+
+def schedule_task_set(ce_chains, task_set, ticks=False, engine='simulation', chain_levels_only=False):
+    """Return the schedules of some task_set.
+    ce_chains is a list of ce_chains that will be computed later on.
+    We need this to compute latency_upper_bound to determine the additional simulation time at the end.
+    With ticks=True, the schedules are simulated and stored in integer ticks (TickSchedule).
+    Tasks without execution time and LET tasks are not recorded by the simulation but
+    constructed in closed form (closed_form_jobs).
+    With engine='analytic', the schedules of periodic task sets are constructed
+    level by level (analytic_schedule) instead of by the event simulator.
+    With chain_levels_only=True, only the tasks down to the lowest priority task of
+    the ce_chains are scheduled (chain_priority_levels).
+    Note:
+    - In case of error, None is returned."""
+
+    if engine not in schedule_engines:
+        raise ValueError(f'{engine} is not a possible argument.')
+
+    separate_bcet = task_set[0].bcet != task_set[0].wcet
+
+    # try:
+    tasks = chain_priority_levels(ce_chains, task_set) if chain_levels_only else task_set
+    sched_interval, horizon = simulation_interval(ce_chains, task_set, tasks)
+    hyper_period = task_set.hyperperiod()
+    scale = es.tick_scale(task_set) if ticks else None
+
+    # Tasks without execution time do not interfere with the other tasks.
+    # (LET tasks are simulated since they still execute.)
+    simulated = [task for task in tasks if task.wcet > 0]
+
+    # Main part: Simulation part for wcet/bcet taskset
+    # (both schedules are created in one pass if bcet and wcet differ)
+    # The simulation stops early if the schedule repeats. Only the jobs until
+    # the end of the first repeating hyperperiod are kept then, later jobs are
+    # obtained by shifting the last hyperperiod (Schedule_Analyzer). Otherwise
+    # (and for the analytic engine), all jobs until the end of the simulation
+    # are kept.
+    end = None  # end of the kept jobs if the schedule repeats
+    if len(simulated) == 0:
+        schedules = dict()
+        schedules['wcet'] = dict()
         schedules['bcet'] = schedules['wcet']
+        end = steady_state_end(task_set)
+    elif engine == 'analytic':
+        schedules = dict()
+        schedules['wcet'] = analytic_schedule(simulated, False, horizon, scale)
+        schedules['bcet'] = (analytic_schedule(simulated, True, horizon, scale)
+                             if separate_bcet else schedules['wcet'])
+    else:
+        if separate_bcet:
+            simulator = es.jointEventSimulator(
+                simulated, recording='array', horizon=horizon,
+                hyperperiod=hyper_period, scale=scale)
+        else:
+            simulator = es.eventSimulator(
+                simulated, False, recording='array', horizon=horizon,
+                hyperperiod=hyper_period, scale=scale)
+
+        # Stop condition: Number of jobs of lowest priority task.
+        simulator.dispatcher(int(math.ceil(sched_interval / simulated[-1].period)))
+
+        # Simulation without early completion.
+        if separate_bcet:
+            schedules = simulator.schedules()
+        else:
+            schedules = dict()
+            schedules['wcet'] = simulator.e2e_result()
+            schedules['bcet'] = schedules['wcet']
+
+        end = repeating_end(simulator)
+        if end is not None:
+            for key in (['wcet', 'bcet'] if separate_bcet else ['wcet']):
+                truncate_schedule(schedules[key], simulated, end)
+
+    # Release-aligned jobs of tasks without execution time and LET tasks.
+    add_closed_form_jobs(tasks, schedules, horizon if end is None else end, scale)
+
+    if ticks:
+        schedules['wcet'] = TickSchedule(schedules['wcet'], scale)
+        schedules['bcet'] = (TickSchedule(schedules['bcet'], scale)
+                             if schedules['bcet'] is not schedules['wcet']
+                             else schedules['wcet'])
 
 
     # except Exception as e:
@@ -134,7 +417,300 @@ def schedule_task_set(ce_chains, task_set):
     return (task_set.id, schedules)
 
 
-def compute_all_schedules(cause_effect_chains, number_of_threads):
+#####
+# Incremental schedule construction
+#####
+
+def job_array(schedule, task, hyperperiod, number):
+    """Return the first number jobs of task in schedule as (number x 2) array
+    in time units. Jobs after the end of the schedule are shifted by hyperperiods (as done by
+    the Schedule_Analyzer). The jobs of task in schedule can be a list or an array."""
+
+    lst = schedule[task.id]
+    if isinstance(lst, LazyJobList):
+        lst.extend_to(number - 1)
+        lst = lst.jobs
+    jobs = np.asarray(lst, dtype=float).reshape(-1, 2)
+    if time_scale(schedule) != 1:
+        jobs = jobs / time_scale(schedule)
+
+    div, rem = divmod(hyperperiod, task.period)
+    assert rem == 0
+    nmbs = np.arange(number)
+    shifts = np.where(nmbs >= len(jobs), -((len(jobs) - 1 - nmbs) // div), 0)
+    return jobs[nmbs - shifts * div] + (shifts * hyperperiod)[:, None]
+
+
+def busy_intervals(tasks, schedule, hyperperiod, end):
+    """Return the sorted disjoint intervals (start, length) before end in which
+    the processor executes jobs of tasks (the highest priority tasks of a task set).
+    Under preemptive fixed-priority scheduling, this is the union of
+    [release, finish) over all jobs of tasks."""
+
+    releases = []
+    finishes = []
+    for task in tasks:
+        number = max(int(math.ceil((end - task.phase) / task.period)), 0)
+        releases.append(task.phase + task.period * np.arange(number))
+        finishes.append(job_array(schedule, task, hyperperiod, number)[:, 1])
+
+    if sum(len(rel) for rel in releases) == 0:
+        return []
+
+    starts, ends = merge_intervals(np.concatenate(releases), np.concatenate(finishes))
+
+    return [(start, end - start) for start, end in zip(starts.tolist(), ends.tolist())]
+
+
+def merge_intervals(starts, ends):
+    """Merge overlapping and adjacent intervals [start, end).
+    Return the starts and ends of the sorted disjoint union as arrays."""
+
+    order = np.argsort(starts, kind='stable')
+    starts = starts[order]
+    ends = np.maximum.accumulate(ends[order])
+    new_interval = np.concatenate(([True], starts[1:] > ends[:-1]))
+    last_in_interval = np.concatenate((np.flatnonzero(new_interval)[1:] - 1, [len(starts) - 1]))
+    return starts[new_interval], ends[last_in_interval]
+
+
+def finished_jobs(task, schedule, hyperperiod, end):
+    """Return the jobs of task that are released and finished before end as (jobs x 2) array."""
+
+    number = max(int(math.ceil((end - task.phase) / task.period)), 0)
+    jobs = job_array(schedule, task, hyperperiod, number)
+    return jobs[:np.searchsorted(jobs[:, 1] > end, True)]
+
+
+def reschedule_task_set(ce_chains, task_set, previous_task_set, previous_schedules):
+    """Return the schedules of task_set like schedule_task_set, based on the
+    schedules of a previously scheduled variant previous_task_set.
+
+    Under preemptive fixed-priority scheduling, the jobs of a task only depend on
+    higher priority tasks. Hence, the tasks before the first position where
+    task_set and previous_task_set differ keep their previous jobs and only the
+    remaining tasks are simulated. The unchanged tasks are taken into account as
+    blocking intervals of the simulator."""
+
+    # Highest changed priority level
+    changed = 0
+    while (changed < min(len(task_set), len(previous_task_set))
+           and task_set[changed] is previous_task_set[changed]):
+        changed += 1
+
+    if changed == len(task_set) == len(previous_task_set):
+        # Nothing changed
+        return (task_set.id, previous_schedules)
+
+    prefix = task_set[:changed]
+    suffix = task_set[changed:]
+
+    separate_bcet = task_set[0].bcet != task_set[0].wcet
+
+    sched_interval, horizon = simulation_interval(ce_chains, task_set)
+    hyper_period = task_set.hyperperiod()
+    # ticks if the previous schedules are in ticks (the changed tasks may need
+    # a finer time base, the unchanged jobs are converted to it)
+    ticks = getattr(previous_schedules['wcet'], 'scale', None) is not None
+    scale = es.tick_scale(task_set) if ticks else None
+
+    simulated = [task for task in suffix if task.wcet > 0]
+    if (len(simulated) == 0
+            or any(task.communication_policy == 'LET' and task.wcet > 0 for task in prefix)
+            or any(task.id not in previous_schedules['wcet'].keys() for task in prefix)):
+        # The previous schedules do not contain the execution of LET tasks
+        # (or not all unchanged tasks were scheduled).
+        return schedule_task_set(ce_chains, task_set, ticks=ticks)
+
+    schedules = dict()
+    closed_form_end = steady_state_end(task_set)
+    for key in (['wcet', 'bcet'] if separate_bcet else ['wcet']):
+        blocking = busy_intervals(
+            [task for task in prefix if task.wcet > 0], previous_schedules[key], previous_task_set.hyperperiod(), horizon)
+
+        # hyperperiod boundaries depend on all tasks of task_set
+        simulator = es.eventSimulator(
+            simulated, key == 'bcet', recording='array', horizon=horizon,
+            hyperperiod=hyper_period, blocking=blocking, scale=scale,
+            boundary=task_set.max_phase())
+
+        # Stop condition: Number of jobs of lowest priority task.
+        simulator.dispatcher(int(math.ceil(sched_interval / simulated[-1].period)))
+
+        schedules[key] = simulator.e2e_result()
+
+        # Jobs of the unchanged tasks until the end of the simulation
+        end = simulator.eventTime if scale is None else simulator.eventTime / scale
+        for task in prefix:
+            jobs = finished_jobs(task, previous_schedules[key], previous_task_set.hyperperiod(), end)
+            if scale is not None:
+                jobs = np.rint(jobs * scale).astype(np.int64)
+            schedules[key][task.id] = job_list(jobs)
+
+        # (truncated only if the schedule repeats, see schedule_task_set)
+        repeating = repeating_end(simulator)
+        if repeating is not None:
+            truncate_schedule(schedules[key], prefix + simulated, repeating)
+        else:
+            closed_form_end = horizon
+
+        if scale is not None:
+            schedules[key] = TickSchedule(schedules[key], scale)
+
+    if not separate_bcet:
+        schedules['bcet'] = schedules['wcet']
+
+    add_closed_form_jobs(suffix, schedules, closed_form_end, scale)
+
+    return (task_set.id, schedules)
+
+
+#####
+# Analytic schedule construction
+#####
+
+def idle_time(times, starts, ends, idle_starts, busy_before):
+    """Return the idle time of the processor until each of times, when it is
+    busy in the sorted disjoint intervals [starts, ends).
+    idle_starts[k] is the idle time at the start of the k-th interval and
+    busy_before[k] is the total length of the first k intervals."""
+
+    k = np.searchsorted(starts, times, 'right')
+    idle = times - busy_before[k]
+    # inside a busy interval, the idle time is the one at its start
+    inside = (k > 0) & (times < np.concatenate(([times.dtype.type(0)], ends))[k])
+    idle[inside] = idle_starts[k[inside] - 1]
+    return idle
+
+
+def idle_inverse(values, idle_starts, busy_before, side):
+    """Return the first ('left') or last ('right') time at which the idle time
+    reaches values."""
+
+    k = np.searchsorted(idle_starts, values, side)
+    return values + busy_before[k]
+
+
+def analytic_jobs(execution, releases, starts, ends):
+    """Return the (start, finish) of the jobs of task with the given releases
+    and execution time as (jobs x 2) array, when the processor is busy with
+    higher priority tasks in the sorted disjoint intervals [starts, ends).
+    All times are integer ticks, so that ties are resolved exactly."""
+
+    busy_before = np.concatenate(([0], np.cumsum(ends - starts))).astype(releases.dtype)
+    idle_starts = starts - busy_before[:-1]
+
+    # Jobs of the task are executed in the idle time in release order, i.e.,
+    # job j finishes when the idle time reached
+    # max(idle at release of job j, finish of job j-1) + execution
+    nmbs = np.arange(len(releases), dtype=releases.dtype)
+    idle_releases = idle_time(releases, starts, ends, idle_starts, busy_before)
+    idle_finishes = (nmbs + 1) * execution + np.maximum.accumulate(idle_releases - nmbs * execution)
+    idle_starts_jobs = np.maximum(idle_releases, np.concatenate((idle_releases[:1], idle_finishes[:-1])))
+
+    job_starts = idle_inverse(idle_starts_jobs, idle_starts, busy_before, 'right')
+    if execution == 0:
+        job_finishes = job_starts
+    else:
+        job_finishes = idle_inverse(idle_finishes, idle_starts, busy_before, 'left')
+    return np.column_stack((job_starts, job_finishes))
+
+
+def analytic_schedule(tasks, bcet, end, scale=None):
+    """Return the schedule of periodic tasks (ordered by priority) under
+    preemptive fixed-priority scheduling with all jobs that are released and
+    finished until end, in the format of eventSimulator.e2e_result().
+
+    Instead of processing events, the jobs are computed level by level:
+    the jobs of each task are executed in the idle time that the higher
+    priority tasks leave, and the union of [release, finish) of all jobs
+    up to that level is the idle time left to the next level.
+    The jobs are always computed in integer ticks (floating point noise would
+    resolve ties differently than the simulator). With scale, the entries are
+    ticks of length 1/scale, otherwise they are converted back to time units
+    (like the entries of a TickSchedule)."""
+
+    ticks = scale is not None
+    if not ticks:
+        scale = es.tick_scale(tasks)
+
+    def to_ticks(value, rounding=round):
+        return es.to_ticks(value, scale, rounding)
+
+    end = to_ticks(end)
+
+    result = dict()
+    starts = np.empty(0, dtype=np.int64)
+    ends = np.empty(0, dtype=np.int64)
+    for task in tasks:
+        if task.release_pattern != 'periodic':
+            raise ValueError('analytic schedules need periodic tasks: ' + str(task.id))
+        phase, period = to_ticks(task.phase), to_ticks(task.period)
+        if bcet:
+            execution = to_ticks(task.bcet, math.floor)
+        else:
+            execution = to_ticks(task.wcet, math.ceil)
+        execution = np.int64(execution)
+
+        number = max(int(math.ceil((end - phase) / period)), 0)
+        releases = phase + period * np.arange(number, dtype=np.int64)
+        jobs = analytic_jobs(execution, releases, starts, ends)
+
+        # jobs that finish after end may miss higher priority jobs released after end
+        result[task.id] = jobs[:np.searchsorted(jobs[:, 1], end, 'right')]
+
+        if number > 0:
+            starts, ends = merge_intervals(
+                np.concatenate((starts, releases)), np.concatenate((ends, jobs[:, 1])))
+
+    if not ticks:
+        return {task_id: job_list(jobs / scale) for task_id, jobs in result.items()}
+    return {task_id: job_list(jobs) for task_id, jobs in result.items()}
+
+
+def schedule_cache_key(ce_chains, task_set, ticks, engine):
+    """Return the number of tasks that schedule_task_set schedules with
+    chain_levels_only=True and the key of these schedules in the cache."""
+
+    tasks = chain_priority_levels(ce_chains, task_set)
+    horizon = simulation_interval(ce_chains, task_set, tasks)[1]
+    key = cache.taskset_key(task_set, 'schedules', len(tasks), horizon, ticks, engine)
+    return len(tasks), key
+
+
+def load_cached_schedules(task_set, number, key, cache_dir, ticks):
+    """Return the schedules of task_set from the cache (in ticks if ticks)
+    or None if they are not cached."""
+
+    schedules = cache.load_schedules(task_set, number, key, cache_dir)
+    if schedules is not None and ticks:
+        scale = es.tick_scale(task_set)
+        schedules['wcet'].scale = schedules['bcet'].scale = scale
+    return schedules
+
+
+def store_schedule_task_set(ce_chains, task_set, ticks, engine, number, key, cache_dir):
+    """Schedule task_set like schedule_task_set with chain_levels_only=True, but
+    store the schedules in the cache instead of returning them, so that they
+    do not have to be sent back from the worker processes."""
+
+    schedules = schedule_task_set(ce_chains, task_set, ticks, engine, True)[1]
+    cache.store_schedules(task_set, number, key, cache_dir, schedules)
+    return task_set.id
+
+
+def compute_all_schedules(cause_effect_chains, number_of_threads, lazy=False, ticks=False, engine='simulation',
+                          cache_dir='', executor=None):
+    """Computes the schedules of all task sets of the given cause-effect chains.
+    With lazy=True, the schedules are only simulated on demand during the analyses.
+    With ticks=True, the schedules are simulated on an integer time base.
+    engine is passed to schedule_task_set (not used for lazy schedules).
+    Only the tasks down to the lowest priority task of the cause-effect chains
+    of a task set are scheduled, since the other tasks do not affect the chains.
+    If cache_dir is given, schedules are loaded from and stored in the cache
+    (see utilities.cache) instead of being computed again. The workers then
+    store the schedules directly and they are memory-mapped from the cache.
+    If executor is given, its workers are used instead of a new pool."""
 
     # cecs can be a list of tuples in case of inteconnected cecs
     # and have to be flattened first to be scheduled
@@ -147,19 +723,45 @@ def compute_all_schedules(cause_effect_chains, number_of_threads):
         else:
             taskset_cecs[cause_effect_chain.base_ts] = [cause_effect_chain]
 
-    # [([ce_chain], taskset), ([ce_chain], taskset), ([ce_chain], taskset), ...]
-    argument_list = []
-    for taskset in taskset_cecs.keys():
-        argument_list.append((taskset_cecs[taskset], taskset))
-
-    with Pool(number_of_threads) as pool:
-        schedule_list = pool.starmap(schedule_task_set, argument_list)
+    if lazy:
+        for taskset in taskset_cecs.keys():
+            taskset.schedules = lazy_schedules(taskset, ticks, taskset_cecs[taskset])
+        return
 
     tasksets = dict()
     for taskset in taskset_cecs.keys():
         tasksets[taskset.id] = taskset
 
-    # schedules :: [(taskset, schedule)]
-    for taskset_id, schedule in schedule_list:
-        assert taskset_id in tasksets.keys()
-        tasksets[taskset_id].schedules = schedule
\ No newline at end of file
+    if not cache_dir:
+        # [([ce_chain], taskset, ...), ([ce_chain], taskset, ...), ...]
+        argument_list = []
+        for taskset in taskset_cecs.keys():
+            argument_list.append((taskset_cecs[taskset], taskset, ticks, engine, True))
+
+        schedule_list = parallel.map_indexed(
+            schedule_task_set, argument_list, number_of_threads, star=True,
+            executor=executor, name='schedules')
+
+        # schedules :: [(taskset, schedule)]
+        for taskset_id, schedule in schedule_list:
+            assert taskset_id in tasksets.keys()
+            tasksets[taskset_id].schedules = schedule
+        return
+
+    cache_keys = dict()
+    argument_list = []
+    for taskset in taskset_cecs.keys():
+        cache_keys[taskset.id] = schedule_cache_key(taskset_cecs[taskset], taskset, ticks, engine)
+        number, key = cache_keys[taskset.id]
+        schedules = load_cached_schedules(taskset, number, key, cache_dir, ticks)
+        if schedules is not None:
+            taskset.schedules = schedules
+        else:
+            argument_list.append((taskset_cecs[taskset], taskset, ticks, engine, number, key, cache_dir))
+
+    for taskset_id in parallel.map_indexed(
+            store_schedule_task_set, argument_list, number_of_threads, star=True,
+            executor=executor, name='schedules'):
+        number, key = cache_keys[taskset_id]
+        tasksets[taskset_id].schedules = load_cached_schedules(
+            tasksets[taskset_id], number, key, cache_dir, ticks)
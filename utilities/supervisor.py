@@ -0,0 +1,166 @@
+"""
+Supervised worker processes with a time and a memory budget per task
+
+Each task runs in a worker process that is watched by the main process. A
+worker that exceeds the time budget is killed, a worker that exceeds the memory
+budget (limit of its address space) stops after the MemoryError. In both cases
+the task is recorded with a distinguished value and a new worker is started,
+so that a single task cannot block the other tasks.
+"""
+
+import copy
+import multiprocessing
+from multiprocessing.connection import wait
+import os
+import time
+import traceback
+
+try:
+    import resource
+except ImportError:  # not available on Windows (no memory budget)
+    resource = None
+
+# distinguished results of tasks that exceeded their budget
+TIMEOUT = 'timeout'
+MEMORY_EXCEEDED = 'memory exceeded'
+BUDGET_EXCEEDED = (TIMEOUT, MEMORY_EXCEEDED)
+
+
+def exceeded(result):
+    """Checks if the result is a distinguished value of an exceeded budget"""
+
+    return isinstance(result, str) and result in BUDGET_EXCEEDED
+
+
+class WorkerError(Exception):
+    """Exception of a task in a supervised worker (with the traceback of the
+    worker as message)"""
+
+
+class _Error:
+    """Result of a task that raised an exception in the worker"""
+
+    def __init__(self, trace):
+        self.trace = trace
+
+
+def _address_space():
+    """Returns the current size of the address space (bytes) or 0 if unknown"""
+
+    try:
+        with open('/proc/self/statm') as file:
+            return int(file.read().split()[0]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError):
+        return 0
+
+
+def _worker(connection, items, memory_budget, isolate):
+    if memory_budget is not None and resource is not None:
+        # the budget is added to the memory that is inherited from the main process
+        limit = _address_space() + memory_budget
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+    while True:
+        task = connection.recv()
+        if task is None:
+            break
+        function, idx = task
+        try:
+            # each task runs on its own copy, so that it cannot change the
+            # items of the following tasks of this worker
+            connection.send(function(isolate(items[idx])))
+        except MemoryError:
+            # the state of the worker is unknown, hence it is replaced
+            connection.send(MEMORY_EXCEEDED)
+            break
+        except Exception:
+            connection.send(_Error(traceback.format_exc()))
+
+
+class _Worker:
+    def __init__(self, items, memory_budget, isolate):
+        self.connection, child_connection = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(target=_worker, args=(child_connection, items, memory_budget, isolate),
+                                               daemon=True)
+        self.process.start()
+        child_connection.close()
+        self.task = None  # number of the current task
+        self.deadline = None
+
+    def start(self, number, task, time_budget):
+        self.task = number
+        self.deadline = None if time_budget is None else time.time() + time_budget
+        self.connection.send(task)
+
+    def stop(self, kill=False):
+        if kill:
+            self.process.kill()
+        else:
+            try:
+                self.connection.send(None)
+            except OSError:
+                pass
+        self.process.join()
+        self.connection.close()
+
+
+def imap_supervised(tasks, items, number_of_threads, time_budget=None, memory_budget=None, isolate=copy.deepcopy):
+    """Yield (number, function(items[idx])) for the (function, idx) tasks in the
+    order in which they are completed by number_of_threads supervised workers.
+    Each task gets a fresh copy isolate(items[idx]) of its item, since a worker
+    runs several tasks on the same items.
+    The result is TIMEOUT if a task runs longer than time_budget seconds and
+    MEMORY_EXCEEDED if it needs more than memory_budget bytes. Other exceptions
+    of a task are raised as WorkerError with the traceback of the worker."""
+
+    pending = list(enumerate(tasks))
+    pending.reverse()
+    workers = [_Worker(items, memory_budget, isolate) for _ in range(min(number_of_threads, len(pending)))]
+
+    try:
+        for worker in workers:
+            worker.start(*pending.pop(), time_budget)
+
+        while any(worker.task is not None for worker in workers):
+            busy = [worker for worker in workers if worker.task is not None]
+            deadlines = [worker.deadline for worker in busy if worker.deadline is not None]
+            timeout = None if len(deadlines) == 0 else max(0, min(deadlines) - time.time())
+            ready = wait([worker.connection for worker in busy], timeout)
+
+            for idx, worker in enumerate(workers):
+                if worker.task is None:
+                    continue
+
+                # Case: task is completed (or the worker died)
+                if worker.connection in ready:
+                    try:
+                        result = worker.connection.recv()
+                    except EOFError:
+                        if memory_budget is None or resource is None:
+                            raise RuntimeError(f'worker of task {worker.task} died')
+                        result = MEMORY_EXCEEDED  # e.g. killed by the system
+                    if isinstance(result, _Error):
+                        raise WorkerError(f'task {worker.task} failed in the worker:\n{result.trace}')
+                    number = worker.task
+                    worker.task = None
+                    if result == MEMORY_EXCEEDED or not worker.process.is_alive():
+                        worker.stop(kill=True)
+                        worker = workers[idx] = _Worker(items, memory_budget, isolate)
+
+                # Case: time budget is exceeded
+                elif worker.deadline is not None and time.time() >= worker.deadline:
+                    number = worker.task
+                    result = TIMEOUT
+                    worker.stop(kill=True)
+                    worker = workers[idx] = _Worker(items, memory_budget, isolate)
+
+                else:
+                    continue
+
+                if len(pending) > 0:
+                    worker.start(*pending.pop(), time_budget)
+                yield number, result
+
+    finally:
+        for worker in workers:
+            worker.stop(kill=worker.task is not None)